@@ -533,11 +533,8 @@ class Orchestrator:
         Returns:
             The new iteration after retry (or previous if no retry)
         """
-        # Register error pattern with supervisor
-        self.supervisor._check_loop(task, previous_iteration)
-
-        # Decide retry strategy
-        strategy, reason = self.supervisor.decide_retry_strategy(task, previous_iteration)
+        # Register error pattern with supervisor and decide retry strategy
+        strategy, reason = self.supervisor.advance(task, previous_iteration)
         failed_count = sum(1 for c in task.conditions if c.check_status != CheckStatus.PASS)
         logger.warning(
             f"Retry strategy: {strategy.value} ({failed_count} failed conditions) - {reason}"
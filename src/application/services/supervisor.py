@@ -128,21 +128,15 @@ class Supervisor:
         # Collect failed conditions from BOTH sources:
         # 1. iteration.check_results (for this iteration's checks)
         # 2. task.conditions (for manual conditions that may not be in check_results)
-        failed_checks: set[str] = set()
-
-        # From iteration check_results
-        for check_id, status in iteration.check_results.items():
-            if status == CheckStatus.FAIL:
-                failed_checks.add(str(check_id))
-
-        # From task conditions (catches manual conditions not re-checked this iteration)
-        for condition in task.conditions:
-            if condition.check_status == CheckStatus.FAIL:
-                failed_checks.add(str(condition.id))
+        failed_checks = iteration.failed_check_ids.union(
+            condition.id
+            for condition in task.conditions
+            if condition.check_status == CheckStatus.FAIL
+        )
 
         if not failed_checks:
             return None
-        content = "|".join(sorted(failed_checks))
+        content = "|".join(sorted(str(check_id) for check_id in failed_checks))
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
     def _check_regression(self, iterations: list[Iteration]) -> SupervisionResult | None:
@@ -219,3 +213,13 @@ class Supervisor:
             return RetryStrategy.STOP, "No changes made, stopping"
 
         return RetryStrategy.CONTINUE_WITH_CONTEXT, "Providing failure feedback"
+
+    def advance(
+        self,
+        task: Task,
+        iteration: Iteration,
+    ) -> tuple[RetryStrategy, str]:
+        """Register the iteration's error pattern, then decide the retry
+        strategy for it."""
+        self._check_loop(task, iteration)
+        return self.decide_retry_strategy(task, iteration)
@@ -1,6 +1,7 @@
 """Use case for selecting MCP servers based on task analysis."""
 
 import json
+from dataclasses import dataclass
 
 from loguru import logger
 
@@ -11,20 +12,14 @@ from src.domain.value_objects.mcp_types import MCPServerRegistry, MCPServerTempl
 from src.infrastructure.utils import extract_json
 
 
+@dataclass(frozen=True, slots=True)
 class MCPSuggestion:
     """Suggestion for an MCP server to use."""
 
-    def __init__(
-        self,
-        server_name: str,
-        reason: str,
-        confidence: float = 0.5,
-        template: MCPServerTemplate | None = None,
-    ) -> None:
-        self.server_name = server_name
-        self.reason = reason
-        self.confidence = confidence
-        self.template = template
+    server_name: str
+    reason: str
+    confidence: float = 0.5
+    template: MCPServerTemplate | None = None
 
 
 class SelectMCPServers:
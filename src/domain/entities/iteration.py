@@ -30,3 +30,12 @@ class Iteration(BaseModel):
     timestamp: datetime = Field(default_factory=_utc_now)
     metrics: dict[str, float] = Field(default_factory=dict)
     artifacts: list[EvidenceRef] = Field(default_factory=list)
+
+    @property
+    def failed_check_ids(self) -> frozenset[UUID]:
+        """IDs of the checks that failed in this iteration."""
+        return frozenset(
+            check_id
+            for check_id, status in self.check_results.items()
+            if status == CheckStatus.FAIL
+        )
@@ -18,12 +18,11 @@ def extract_json(response: str) -> Any:
         json_lines: list[str] = []
         in_block = False
         for line in lines:
-            if line.strip().startswith("```") and not in_block:
+            if line.strip().startswith("```"):
+                if in_block:
+                    break
                 in_block = True
-                continue
-            if line.strip().startswith("```") and in_block:
-                break
-            if in_block:
+            elif in_block:
                 json_lines.append(line)
         if json_lines:
             json_str = "\n".join(json_lines)
@@ -60,6 +60,7 @@ class TestCommandCheckRunner:
         assert result.status == CheckStatus.FAIL
         assert result.exit_code == 1
 
+    @pytest.mark.slow
     async def test_timeout_kills_process_and_returns_fail(
         self,
         runner: CommandCheckRunner,
@@ -0,0 +1,81 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.dto.task_input import TaskInput
+from src.application.orchestrator import Orchestrator
+from src.domain.ports.agent_port import AgentResult
+from src.domain.value_objects.evidence_types import EvidenceRef
+
+
+@pytest.fixture(scope="session")
+def evidence_ref():
+    """Evidence for conditions that tests mark as passed."""
+    return EvidenceRef(
+        task_id=uuid4(),
+        condition_id=uuid4(),
+        check_id=None,
+        artifact_path_rel="evidence.json",
+        log_path_rel=None,
+    )
+
+
+@pytest.fixture
+def tmp_path_str(tmp_path):
+    return str(tmp_path)
+
+
+@pytest.fixture
+def mock_agent():
+    agent = AsyncMock()
+    agent.execute.return_value = AgentResult(
+        messages=[],
+        final_response='{"goal": "Test", "steps": [{"number": 1, "description": "Step 1"}]}',
+        tools_used=["Read"],
+    )
+    return agent
+
+
+@pytest.fixture
+def mock_verification_port():
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_check_runner():
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_diff_port():
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_task_repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def orchestrator(
+    mock_agent, mock_verification_port, mock_check_runner, mock_diff_port, mock_task_repo, tmp_path
+):
+    return Orchestrator(
+        agent=mock_agent,
+        verification_port=mock_verification_port,
+        check_runner=mock_check_runner,
+        diff_port=mock_diff_port,
+        task_repo=mock_task_repo,
+        state_dir=tmp_path,
+    )
+
+
+@pytest.fixture
+def task_input(tmp_path):
+    return TaskInput(
+        description="Test task",
+        goals=["Goal 1"],
+        workspace_path=tmp_path,
+        auto_approve=True,
+    )
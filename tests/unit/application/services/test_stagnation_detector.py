@@ -18,9 +18,10 @@ from src.domain.value_objects.stagnation_action import StagnationAction
 
 # Use fixed UUIDs for check IDs in tests
 CHECK_ID_1 = UUID("00000000-0000-0000-0000-000000000001")
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def detector() -> StagnationDetector:
     return StagnationDetector(limit=3)
 
@@ -39,6 +40,7 @@ def make_iteration(
         decision_reason="test",
         check_results=check_results or {},
         metrics=metrics or {},
+        timestamp=_FIXED_TS,
     )
 
 
@@ -0,0 +1,176 @@
+"""Unit tests for Orchestrator.run() approval callbacks."""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.application.dto.final_result import FinalResult
+from src.application.dto.task_input import TaskInput
+from src.application.orchestrator import OrchestrationCallbacks
+from src.domain.entities.budget import Budget
+from src.domain.entities.condition import Condition
+from src.domain.entities.iteration import Iteration, IterationDecision
+from src.domain.entities.plan import Plan, PlanStep
+from src.domain.entities.task import Task
+from src.domain.services.multi_repo_manager import WorkspaceInfo
+from src.domain.value_objects.condition_enums import CheckStatus, ConditionRole
+from src.domain.value_objects.task_status import TaskStatus
+
+
+@pytest.fixture
+def runnable_orchestrator(orchestrator, tmp_path, tmp_path_str, evidence_ref):
+    """Orchestrator with every run() stage stubbed around an already-done
+    task, awaiting manual approval."""
+    task = Task(
+        id=uuid4(),
+        description="Test",
+        goals=["Goal"],
+        sources=[tmp_path_str],
+        budget=Budget(max_iterations=10),
+    )
+    task.plan = Plan(
+        goal="Test",
+        boundaries=[],
+        steps=[PlanStep(number=1, description="Step")],
+    )
+    cond = Condition(
+        id=uuid4(),
+        description="Test",
+        role=ConditionRole.BLOCKING,
+    )
+    cond.check_status = CheckStatus.PASS
+    cond.approve()
+    cond.evidence_ref = evidence_ref
+    task.conditions = [cond]
+
+    with (
+        patch.object(
+            orchestrator.multi_repo_manager, "discover_repos", new_callable=AsyncMock
+        ) as mock_discover,
+        patch.object(orchestrator.intake, "execute", new_callable=AsyncMock) as mock_intake,
+        patch.object(orchestrator.build_inventory, "execute", new_callable=AsyncMock),
+        patch.object(orchestrator.create_plan, "execute", new_callable=AsyncMock),
+        patch.object(orchestrator.execute_delivery, "execute", new_callable=AsyncMock) as mock_exec,
+        patch.object(orchestrator.finalize, "execute", new_callable=AsyncMock) as mock_finalize,
+    ):
+        mock_discover.return_value = WorkspaceInfo(
+            is_workspace=False, repos=[tmp_path], root=tmp_path
+        )
+        mock_intake.return_value = task
+        mock_exec.return_value = Iteration(
+            number=1,
+            goal="Test",
+            changes=["file.py"],
+            check_results={},
+            decision=IterationDecision.DONE,
+            decision_reason="Done",
+            timestamp=datetime.now(UTC),
+        )
+        mock_finalize.return_value = FinalResult(
+            task_id=task.id,
+            status=TaskStatus.DONE,
+            diff="",
+            patch="",
+            summary="Done",
+            conditions=[],
+            evidence_refs=[],
+        )
+
+        yield SimpleNamespace(
+            orchestrator=orchestrator,
+            task=task,
+            task_input=TaskInput(
+                description="Test",
+                goals=["Goal"],
+                workspace_path=tmp_path,
+                auto_approve=False,  # Not auto-approve to trigger callback
+            ),
+            finalize=mock_finalize,
+        )
+
+
+class TestRunWithCallbacks:
+    @pytest.mark.asyncio
+    async def test_run_with_plan_and_conditions_callback(self, runnable_orchestrator):
+        """Run() should handle plan_and_conditions_callback."""
+        callback_called = False
+
+        def plan_callback(_plan, conditions):
+            nonlocal callback_called
+            callback_called = True
+            return (True, None, conditions)  # Approve
+
+        await runnable_orchestrator.orchestrator.run(
+            runnable_orchestrator.task_input,
+            callbacks=OrchestrationCallbacks(plan_and_conditions=plan_callback),
+        )
+
+        assert callback_called
+
+    @pytest.mark.asyncio
+    async def test_run_with_plan_callback_refine(self, runnable_orchestrator):
+        """Run() should refine plan when callback provides feedback."""
+        orchestrator = runnable_orchestrator.orchestrator
+        call_count = 0
+
+        def plan_callback(_plan, conditions):
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                return (False, "Add more detail", conditions)  # Reject with feedback
+            return (True, None, conditions)  # Approve on second call
+
+        with patch.object(
+            orchestrator.create_plan, "refine", new_callable=AsyncMock
+        ) as mock_refine:
+            mock_refine.return_value = runnable_orchestrator.task.plan
+
+            await orchestrator.run(
+                runnable_orchestrator.task_input,
+                callbacks=OrchestrationCallbacks(plan_and_conditions=plan_callback),
+            )
+
+            # refine should have been called once
+            mock_refine.assert_called_once()
+            assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_run_with_deprecated_plan_approval_callback(self, runnable_orchestrator):
+        """Run() should handle deprecated plan_approval_callback."""
+
+        def deprecated_callback(_plan):
+            return (True, None)  # Approve
+
+        result = await runnable_orchestrator.orchestrator.run(
+            runnable_orchestrator.task_input,
+            callbacks=OrchestrationCallbacks(plan_approval=deprecated_callback),
+        )
+
+        assert result.status == TaskStatus.DONE
+
+    @pytest.mark.asyncio
+    async def test_run_plan_rejected_without_feedback(self, runnable_orchestrator):
+        """Run() should block when plan rejected without feedback."""
+        task = runnable_orchestrator.task
+        runnable_orchestrator.finalize.return_value = FinalResult(
+            task_id=task.id,
+            status=TaskStatus.BLOCKED,
+            diff="",
+            patch="",
+            summary="Blocked",
+            conditions=[],
+            evidence_refs=[],
+        )
+
+        def reject_callback(_plan, conditions):
+            return (False, None, conditions)  # Reject without feedback
+
+        result = await runnable_orchestrator.orchestrator.run(
+            runnable_orchestrator.task_input,
+            callbacks=OrchestrationCallbacks(plan_and_conditions=reject_callback),
+        )
+
+        assert result.status == TaskStatus.BLOCKED
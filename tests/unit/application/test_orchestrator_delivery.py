@@ -0,0 +1,163 @@
+"""Unit tests for Orchestrator._continue_from_delivery."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.application.dto.final_result import FinalResult
+from src.domain.entities.budget import Budget
+from src.domain.entities.condition import Condition
+from src.domain.entities.iteration import Iteration, IterationDecision
+from src.domain.entities.task import Task
+from src.domain.value_objects.condition_enums import CheckStatus, ConditionRole
+from src.domain.value_objects.task_status import TaskStatus
+
+
+class TestContinueFromDelivery:
+    @pytest.mark.asyncio
+    async def test_continue_from_delivery_already_done(
+        self, orchestrator, task_input, tmp_path_str, evidence_ref
+    ):
+        """_continue_from_delivery should skip execution if task already
+        done."""
+        task = Task(
+            id=uuid4(),
+            description="Test",
+            goals=["Goal"],
+            sources=[tmp_path_str],
+            budget=Budget(max_iterations=10),
+        )
+        # Mark all conditions as passed
+        cond = Condition(
+            id=uuid4(),
+            description="Test",
+            role=ConditionRole.BLOCKING,
+        )
+        cond.check_status = CheckStatus.PASS
+        cond.approve()
+        cond.evidence_ref = evidence_ref
+        task.conditions = [cond]
+
+        with (
+            patch.object(
+                orchestrator.execute_delivery, "execute", new_callable=AsyncMock
+            ) as mock_exec,
+            patch.object(
+                orchestrator.run_quality, "execute", new_callable=AsyncMock
+            ) as mock_quality,
+            patch.object(orchestrator.finalize, "execute", new_callable=AsyncMock) as mock_finalize,
+        ):
+            mock_finalize.return_value = FinalResult(
+                task_id=task.id,
+                status=TaskStatus.DONE,
+                diff="",
+                patch="",
+                summary="Done",
+                conditions=[],
+                evidence_refs=[],
+            )
+
+            await orchestrator._continue_from_delivery(task, task_input)
+
+            # Should not execute since task is already done
+            mock_exec.assert_not_called()
+            mock_quality.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_continue_from_delivery_budget_exhausted(
+        self, orchestrator, task_input, tmp_path_str
+    ):
+        """_continue_from_delivery should skip execution if budget
+        exhausted."""
+        task = Task(
+            id=uuid4(),
+            description="Test",
+            goals=["Goal"],
+            sources=[tmp_path_str],
+            budget=Budget(max_iterations=10, iteration_count=10),
+        )
+
+        with (
+            patch.object(
+                orchestrator.execute_delivery, "execute", new_callable=AsyncMock
+            ) as mock_exec,
+            patch.object(orchestrator.finalize, "execute", new_callable=AsyncMock) as mock_finalize,
+        ):
+            mock_finalize.return_value = FinalResult(
+                task_id=task.id,
+                status=TaskStatus.STOPPED,
+                diff="",
+                patch="",
+                summary="Stopped",
+                conditions=[],
+                evidence_refs=[],
+            )
+
+            await orchestrator._continue_from_delivery(task, task_input)
+
+            mock_exec.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_continue_from_delivery_starts_budget_tracking(
+        self, orchestrator, task_input, tmp_path_str, evidence_ref
+    ):
+        """_continue_from_delivery should start budget tracking if not
+        started."""
+        task = Task(
+            id=uuid4(),
+            description="Test",
+            goals=["Goal"],
+            sources=[tmp_path_str],
+            budget=Budget(max_iterations=10),
+        )
+        task.budget.start_timestamp = 0  # Not started
+
+        # Add a failing condition so delivery actually runs
+        cond = Condition(
+            id=uuid4(),
+            description="Test",
+            role=ConditionRole.BLOCKING,
+        )
+        cond.check_status = CheckStatus.FAIL  # Failing initially
+        task.conditions = [cond]
+
+        call_count = 0
+
+        async def mock_execute(*_args, **_kwargs):
+            nonlocal call_count
+            call_count += 1
+            # After first execution, mark condition as passed
+            cond.check_status = CheckStatus.PASS
+            cond.approve()
+            cond.evidence_ref = evidence_ref
+            return Iteration(
+                number=call_count,
+                goal="Test",
+                changes=["file.py"],
+                check_results={},
+                decision=IterationDecision.DONE,
+                decision_reason="Done",
+                timestamp=datetime.now(UTC),
+            )
+
+        with (
+            patch.object(orchestrator.execute_delivery, "execute", side_effect=mock_execute),
+            patch.object(orchestrator.run_quality, "execute", new_callable=AsyncMock),
+            patch.object(orchestrator.finalize, "execute", new_callable=AsyncMock) as mock_finalize,
+        ):
+            mock_finalize.return_value = FinalResult(
+                task_id=task.id,
+                status=TaskStatus.DONE,
+                diff="",
+                patch="",
+                summary="Done",
+                conditions=[],
+                evidence_refs=[],
+            )
+
+            await orchestrator._continue_from_delivery(task, task_input)
+
+            # Budget tracking should have started
+            assert task.budget.start_timestamp > 0
@@ -1,5 +1,6 @@
 """Comprehensive unit tests for Orchestrator methods."""
 
+from contextlib import ExitStack, contextmanager
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -10,16 +11,14 @@ from src.application.dto.final_result import FinalResult
 from src.application.dto.task_input import TaskInput
 from src.application.orchestrator import OrchestrationCallbacks, Orchestrator
 from src.domain.entities.budget import Budget
-from src.domain.entities.condition import Condition
 from src.domain.entities.iteration import Iteration, IterationDecision
 from src.domain.entities.plan import Plan, PlanStep
 from src.domain.entities.task import Task
 from src.domain.entities.verification_inventory import VerificationInventory
-from src.domain.ports.agent_port import AgentResult
 from src.domain.ports.diff_port import DiffResult
 from src.domain.services.multi_repo_manager import WorkspaceInfo
 from src.domain.value_objects.check_types import CheckKind, CheckSpec
-from src.domain.value_objects.condition_enums import CheckStatus, ConditionRole
+from src.domain.value_objects.condition_enums import CheckStatus
 from src.domain.value_objects.mcp_types import (
     MCPInstallSource,
     MCPServerConfig,
@@ -29,16 +28,30 @@ from src.domain.value_objects.mcp_types import (
 )
 from src.domain.value_objects.task_status import TaskStatus
 
+# Shared by tests that stub out plan approval and never mutate the plan.
+_DEFAULT_PLAN = Plan(
+    goal="Test",
+    boundaries=[],
+    steps=[PlanStep(number=1, description="Step")],
+)
 
-@pytest.fixture
-def mock_agent():
-    agent = AsyncMock()
-    agent.execute.return_value = AgentResult(
-        messages=[],
-        final_response='{"goal": "Test", "steps": [{"number": 1, "description": "Step 1"}]}',
-        tools_used=["Read"],
-    )
-    return agent
+
+@contextmanager
+def stub_use_cases(orchestrator, **return_values):
+    """Patch ``execute`` of each named orchestrator use case with an
+    AsyncMock returning the given value."""
+    with ExitStack() as stack:
+        yield {
+            name: stack.enter_context(
+                patch.object(
+                    getattr(orchestrator, name),
+                    "execute",
+                    new_callable=AsyncMock,
+                    return_value=value,
+                )
+            )
+            for name, value in return_values.items()
+        }
 
 
 @pytest.fixture
@@ -92,30 +105,6 @@ def mock_task_repo():
     return repo
 
 
-@pytest.fixture
-def orchestrator(
-    mock_agent, mock_verification_port, mock_check_runner, mock_diff_port, mock_task_repo, tmp_path
-):
-    return Orchestrator(
-        agent=mock_agent,
-        verification_port=mock_verification_port,
-        check_runner=mock_check_runner,
-        diff_port=mock_diff_port,
-        task_repo=mock_task_repo,
-        state_dir=tmp_path,
-    )
-
-
-@pytest.fixture
-def task_input(tmp_path):
-    return TaskInput(
-        description="Test task",
-        goals=["Goal 1"],
-        workspace_path=tmp_path,
-        auto_approve=True,
-    )
-
-
 class TestDiscoverWorkspace:
     @pytest.mark.asyncio
     async def test_discover_workspace_sets_workspace_info(self, orchestrator, tmp_path):
@@ -185,7 +174,9 @@ class TestStashAllRepos:
         mock_diff_port.stash_all_repos.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_stash_all_repos_handles_failure(self, orchestrator, mock_diff_port, tmp_path):
+    async def test_stash_all_repos_handles_failure(
+        self, orchestrator, mock_diff_port, tmp_path, tmp_path_str
+    ):
         """stash_all_repos should handle stash failures gracefully."""
         orchestrator._workspace_manager._workspace_info = WorkspaceInfo(
             is_workspace=False,
@@ -193,7 +184,7 @@ class TestStashAllRepos:
             root=tmp_path,
         )
         mock_diff_port.stash_all_repos.return_value = [
-            MagicMock(repo_path=str(tmp_path), success=False, error="No changes")
+            MagicMock(repo_path=tmp_path_str, success=False, error="No changes")
         ]
 
         # Should not raise
@@ -316,110 +307,96 @@ class TestSetupMcpServers:
 class TestOrchestratorRun:
     @pytest.mark.asyncio
     async def test_run_full_pipeline_auto_approve(
-        self, orchestrator, task_input, mock_agent, mock_diff_port, mock_task_repo, tmp_path
+        self,
+        orchestrator,
+        task_input,
+        mock_agent,
+        mock_diff_port,
+        mock_task_repo,
+        tmp_path,
+        tmp_path_str,
+        evidence_ref,
     ):
         """Run() should complete full pipeline with auto_approve."""
-        # Setup workspace discovery
-        with patch.object(
-            orchestrator.multi_repo_manager,
-            "discover_repos",
-            new_callable=AsyncMock,
-        ) as mock_discover:
+        task = Task(
+            id=uuid4(),
+            description="Test task",
+            goals=["Goal 1"],
+            sources=[tmp_path_str],
+            budget=Budget(max_iterations=10),
+        )
+        inventory = VerificationInventory(
+            checks=[
+                CheckSpec(
+                    id=uuid4(),
+                    name="test_check",
+                    kind=CheckKind.TEST,
+                    command="pytest",
+                    cwd=tmp_path_str,
+                )
+            ],
+            baseline=None,
+            project_structure={},
+            conventions=[],
+        )
+        task.verification_inventory = inventory
+        plan = Plan(
+            goal="Test goal",
+            boundaries=[],
+            steps=[PlanStep(number=1, description="Step 1")],
+        )
+        task.plan = plan
+        iteration = Iteration(
+            number=1,
+            goal="Execute",
+            changes=["file.py"],
+            check_results={},
+            decision=IterationDecision.DONE,
+            decision_reason="Done",
+            timestamp=datetime.now(UTC),
+        )
+
+        # Make task done
+        for cond in task.conditions:
+            cond.check_status = CheckStatus.PASS
+            cond.approve()
+            cond.evidence_ref = evidence_ref
+
+        final_result = FinalResult(
+            task_id=task.id,
+            status=TaskStatus.DONE,
+            diff="",
+            patch="",
+            summary="Done",
+            conditions=[],
+            evidence_refs=[],
+        )
+
+        with (
+            patch.object(
+                orchestrator.multi_repo_manager, "discover_repos", new_callable=AsyncMock
+            ) as mock_discover,
+            stub_use_cases(
+                orchestrator,
+                intake=task,
+                build_inventory=inventory,
+                create_plan=plan,
+                execute_delivery=iteration,
+                finalize=final_result,
+            ),
+        ):
             mock_discover.return_value = WorkspaceInfo(
                 is_workspace=False,
                 repos=[tmp_path],
                 root=tmp_path,
             )
 
-            # Setup intake to return task
-            task = Task(
-                id=uuid4(),
-                description="Test task",
-                goals=["Goal 1"],
-                sources=[str(tmp_path)],
-                budget=Budget(max_iterations=10),
-            )
-
-            with patch.object(
-                orchestrator.intake, "execute", new_callable=AsyncMock
-            ) as mock_intake:
-                mock_intake.return_value = task
+            result = await orchestrator.run(task_input)
 
-                # Setup build_inventory
-                inventory = VerificationInventory(
-                    checks=[
-                        CheckSpec(
-                            id=uuid4(),
-                            name="test_check",
-                            kind=CheckKind.TEST,
-                            command="pytest",
-                            cwd=str(tmp_path),
-                        )
-                    ],
-                    baseline=None,
-                    project_structure={},
-                    conventions=[],
-                )
-                with patch.object(
-                    orchestrator.build_inventory, "execute", new_callable=AsyncMock
-                ) as mock_build:
-                    mock_build.return_value = inventory
-                    task.verification_inventory = inventory
-
-                    # Setup create_plan
-                    plan = Plan(
-                        goal="Test goal",
-                        boundaries=[],
-                        steps=[PlanStep(number=1, description="Step 1")],
-                    )
-                    with patch.object(
-                        orchestrator.create_plan, "execute", new_callable=AsyncMock
-                    ) as mock_plan:
-                        mock_plan.return_value = plan
-                        task.plan = plan
-
-                        # Setup execute_delivery
-                        iteration = Iteration(
-                            number=1,
-                            goal="Execute",
-                            changes=["file.py"],
-                            check_results={},
-                            decision=IterationDecision.DONE,
-                            decision_reason="Done",
-                            timestamp=datetime.now(UTC),
-                        )
-                        with patch.object(
-                            orchestrator.execute_delivery, "execute", new_callable=AsyncMock
-                        ) as mock_exec:
-                            mock_exec.return_value = iteration
-
-                            # Make task done
-                            for cond in task.conditions:
-                                cond.check_status = CheckStatus.PASS
-                                cond.approve()
-                                cond.evidence_ref = MagicMock()
-
-                            # Setup finalize
-                            final_result = FinalResult(
-                                task_id=task.id,
-                                status=TaskStatus.DONE,
-                                diff="",
-                                patch="",
-                                summary="Done",
-                                conditions=[],
-                                evidence_refs=[],
-                            )
-                            with patch.object(
-                                orchestrator.finalize, "execute", new_callable=AsyncMock
-                            ) as mock_finalize:
-                                mock_finalize.return_value = final_result
-
-                                result = await orchestrator.run(task_input)
-
-                                assert result.status == TaskStatus.DONE
+            assert result.status == TaskStatus.DONE
 
     @pytest.mark.asyncio
-    async def test_run_with_stage_callback(self, orchestrator, task_input, tmp_path):
+    async def test_run_with_stage_callback(self, orchestrator, task_input, tmp_path, tmp_path_str):
         """Run() should call stage callback."""
         stage_calls = []
 
@@ -437,7 +414,7 @@ class TestOrchestratorRun:
                 id=uuid4(),
                 description="Test",
                 goals=["Goal"],
-                sources=[str(tmp_path)],
+                sources=[tmp_path_str],
             )
 
             with patch.object(
@@ -480,13 +457,13 @@ class TestOrchestratorRun:
 
 class TestOrchestratorResume:
     @pytest.mark.asyncio
-    async def test_resume_from_intake_status(self, orchestrator, task_input, tmp_path):
+    async def test_resume_from_intake_status(self, orchestrator, task_input, tmp_path_str):
         """Resume() should handle INTAKE status."""
         task = Task(
             id=uuid4(),
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[tmp_path_str],
             budget=Budget(max_iterations=10),
         )
         task.status = TaskStatus.INTAKE
@@ -515,13 +492,13 @@ class TestOrchestratorResume:
                 assert result.status == TaskStatus.DONE
 
     @pytest.mark.asyncio
-    async def test_resume_from_strategy_status(self, orchestrator, task_input, tmp_path):
+    async def test_resume_from_strategy_status(self, orchestrator, task_input, tmp_path_str):
         """Resume() should handle STRATEGY status."""
         task = Task(
             id=uuid4(),
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[tmp_path_str],
         )
         task.status = TaskStatus.STRATEGY
 
@@ -549,23 +526,19 @@ class TestOrchestratorResume:
 
     @pytest.mark.asyncio
     async def test_resume_from_verification_inventory_status(
-        self, orchestrator, task_input, tmp_path
+        self, orchestrator, task_input, tmp_path_str
     ):
         """Resume() should handle VERIFICATION_INVENTORY status."""
         task = Task(
             id=uuid4(),
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[tmp_path_str],
         )
         task.status = TaskStatus.VERIFICATION_INVENTORY
 
         with patch.object(orchestrator.create_plan, "execute", new_callable=AsyncMock) as mock_plan:
-            task.plan = Plan(
-                goal="Test",
-                boundaries=[],
-                steps=[PlanStep(number=1, description="Step")],
-            )
+            task.plan = _DEFAULT_PLAN
 
             with (
                 patch.object(orchestrator.define_conditions, "execute", new_callable=AsyncMock),
@@ -589,13 +562,13 @@ class TestOrchestratorResume:
                 mock_continue.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_resume_from_planning_status(self, orchestrator, task_input, tmp_path):
+    async def test_resume_from_planning_status(self, orchestrator, task_input, tmp_path_str):
         """Resume() should handle PLANNING status."""
         task = Task(
             id=uuid4(),
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[tmp_path_str],
         )
         task.status = TaskStatus.PLANNING
 
@@ -620,13 +593,13 @@ class TestOrchestratorResume:
             mock_continue.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_resume_from_conditions_status(self, orchestrator, task_input, tmp_path):
+    async def test_resume_from_conditions_status(self, orchestrator, task_input, tmp_path_str):
         """Resume() should handle CONDITIONS status."""
         task = Task(
             id=uuid4(),
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[tmp_path_str],
         )
         task.status = TaskStatus.CONDITIONS
 
@@ -648,13 +621,15 @@ class TestOrchestratorResume:
             mock_continue.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_resume_from_approval_conditions_status(self, orchestrator, task_input, tmp_path):
+    async def test_resume_from_approval_conditions_status(
+        self, orchestrator, task_input, tmp_path_str
+    ):
         """Resume() should handle APPROVAL_CONDITIONS status."""
         task = Task(
             id=uuid4(),
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[tmp_path_str],
         )
         task.status = TaskStatus.APPROVAL_CONDITIONS
 
@@ -676,13 +651,13 @@ class TestOrchestratorResume:
             mock_continue.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_resume_from_approval_plan_status(self, orchestrator, task_input, tmp_path):
+    async def test_resume_from_approval_plan_status(self, orchestrator, task_input, tmp_path_str):
         """Resume() should handle APPROVAL_PLAN status."""
         task = Task(
             id=uuid4(),
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[tmp_path_str],
         )
         task.status = TaskStatus.APPROVAL_PLAN
 
@@ -704,13 +679,13 @@ class TestOrchestratorResume:
             mock_continue.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_resume_from_executing_status(self, orchestrator, task_input, tmp_path):
+    async def test_resume_from_executing_status(self, orchestrator, task_input, tmp_path_str):
         """Resume() should handle EXECUTING status."""
         task = Task(
             id=uuid4(),
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[tmp_path_str],
         )
         task.status = TaskStatus.EXECUTING
 
@@ -732,13 +707,13 @@ class TestOrchestratorResume:
             mock_continue.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_resume_from_quality_status(self, orchestrator, task_input, tmp_path):
+    async def test_resume_from_quality_status(self, orchestrator, task_input, tmp_path_str):
         """Resume() should handle QUALITY status."""
         task = Task(
             id=uuid4(),
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[tmp_path_str],
         )
         task.status = TaskStatus.QUALITY
 
@@ -760,13 +735,13 @@ class TestOrchestratorResume:
             mock_continue.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_resume_from_done_status(self, orchestrator, task_input, tmp_path):
+    async def test_resume_from_done_status(self, orchestrator, task_input, tmp_path_str):
         """Resume() should finalize DONE status tasks."""
         task = Task(
             id=uuid4(),
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[tmp_path_str],
         )
         task.status = TaskStatus.DONE
 
@@ -790,14 +765,14 @@ class TestOrchestratorResume:
 
 class TestContinueFromInventory:
     @pytest.mark.asyncio
-    async def test_continue_from_inventory(self, orchestrator, task_input, tmp_path):
+    async def test_continue_from_inventory(self, orchestrator, task_input, tmp_path_str):
         """_continue_from_inventory should run inventory, plan, conditions,
         approval."""
         task = Task(
             id=uuid4(),
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[tmp_path_str],
         )
         strategy = MagicMock(include_baseline=True)
 
@@ -807,11 +782,7 @@ class TestContinueFromInventory:
             ) as mock_build,
             patch.object(orchestrator.create_plan, "execute", new_callable=AsyncMock) as mock_plan,
         ):
-            task.plan = Plan(
-                goal="Test",
-                boundaries=[],
-                steps=[PlanStep(number=1, description="Step")],
-            )
+            task.plan = _DEFAULT_PLAN
 
             with (
                 patch.object(orchestrator.define_conditions, "execute", new_callable=AsyncMock),
@@ -840,249 +811,77 @@ class TestContinueFromInventory:
 class TestContinueFromApproval:
     @pytest.mark.asyncio
     async def test_continue_from_approval_conditions_not_approved(
-        self, orchestrator, task_input, tmp_path
+        self, orchestrator, task_input, tmp_path_str
     ):
         """_continue_from_approval should block if conditions not approved."""
         task = Task(
             id=uuid4(),
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[tmp_path_str],
+        )
+        blocked = FinalResult(
+            task_id=task.id,
+            status=TaskStatus.BLOCKED,
+            diff="",
+            patch="",
+            summary="Blocked",
+            conditions=[],
+            evidence_refs=[],
         )
 
-        with patch.object(
-            orchestrator.approve_conditions, "execute", new_callable=AsyncMock
-        ) as mock_approve:
-            mock_approve.return_value = False
-
-            with patch.object(
-                orchestrator.finalize, "execute", new_callable=AsyncMock
-            ) as mock_finalize:
-                mock_finalize.return_value = FinalResult(
-                    task_id=task.id,
-                    status=TaskStatus.BLOCKED,
-                    diff="",
-                    patch="",
-                    summary="Blocked",
-                    conditions=[],
-                    evidence_refs=[],
-                )
-
-                result = await orchestrator._continue_from_approval(task, task_input)
+        with stub_use_cases(orchestrator, approve_conditions=False, finalize=blocked):
+            result = await orchestrator._continue_from_approval(task, task_input)
 
-                assert task.status == TaskStatus.BLOCKED
-                assert result.status == TaskStatus.BLOCKED
+            assert task.status == TaskStatus.BLOCKED
+            assert result.status == TaskStatus.BLOCKED
 
     @pytest.mark.asyncio
     async def test_continue_from_approval_plan_not_approved(
-        self, orchestrator, task_input, tmp_path
+        self, orchestrator, task_input, tmp_path_str
     ):
         """_continue_from_approval should block if plan not approved."""
         task = Task(
             id=uuid4(),
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
-        )
-
-        with patch.object(
-            orchestrator.approve_conditions, "execute", new_callable=AsyncMock
-        ) as mock_approve_cond:
-            mock_approve_cond.return_value = True
-
-            with patch.object(
-                orchestrator.approve_plan, "execute", new_callable=AsyncMock
-            ) as mock_approve_plan:
-                mock_approve_plan.return_value = False
-
-                with patch.object(
-                    orchestrator.finalize, "execute", new_callable=AsyncMock
-                ) as mock_finalize:
-                    mock_finalize.return_value = FinalResult(
-                        task_id=task.id,
-                        status=TaskStatus.BLOCKED,
-                        diff="",
-                        patch="",
-                        summary="Blocked",
-                        conditions=[],
-                        evidence_refs=[],
-                    )
-
-                    result = await orchestrator._continue_from_approval(task, task_input)
-
-                    assert task.status == TaskStatus.BLOCKED
-                    assert result.status == TaskStatus.BLOCKED
-
-    @pytest.mark.asyncio
-    async def test_continue_from_approval_success(self, orchestrator, task_input, tmp_path):
-        """_continue_from_approval should continue to delivery if approved."""
-        task = Task(
-            id=uuid4(),
-            description="Test",
-            goals=["Goal"],
-            sources=[str(tmp_path)],
-        )
-
-        with patch.object(
-            orchestrator.approve_conditions, "execute", new_callable=AsyncMock
-        ) as mock_approve_cond:
-            mock_approve_cond.return_value = True
-
-            with patch.object(
-                orchestrator.approve_plan, "execute", new_callable=AsyncMock
-            ) as mock_approve_plan:
-                mock_approve_plan.return_value = True
-
-                with patch.object(
-                    orchestrator, "_continue_from_delivery", new_callable=AsyncMock
-                ) as mock_continue:
-                    mock_continue.return_value = FinalResult(
-                        task_id=task.id,
-                        status=TaskStatus.DONE,
-                        diff="",
-                        patch="",
-                        summary="Done",
-                        conditions=[],
-                        evidence_refs=[],
-                    )
-
-                    result = await orchestrator._continue_from_approval(task, task_input)
-
-                    mock_continue.assert_called_once()
-                    assert result.status == TaskStatus.DONE
-
-
-class TestContinueFromDelivery:
-    @pytest.mark.asyncio
-    async def test_continue_from_delivery_already_done(self, orchestrator, task_input, tmp_path):
-        """_continue_from_delivery should skip execution if task already
-        done."""
-        task = Task(
-            id=uuid4(),
-            description="Test",
-            goals=["Goal"],
-            sources=[str(tmp_path)],
-            budget=Budget(max_iterations=10),
+            sources=[tmp_path_str],
         )
-        # Mark all conditions as passed
-        cond = Condition(
-            id=uuid4(),
-            description="Test",
-            role=ConditionRole.BLOCKING,
+        blocked = FinalResult(
+            task_id=task.id,
+            status=TaskStatus.BLOCKED,
+            diff="",
+            patch="",
+            summary="Blocked",
+            conditions=[],
+            evidence_refs=[],
         )
-        cond.check_status = CheckStatus.PASS
-        cond.approve()
-        cond.evidence_ref = MagicMock()
-        task.conditions = [cond]
 
-        with (
-            patch.object(
-                orchestrator.execute_delivery, "execute", new_callable=AsyncMock
-            ) as mock_exec,
-            patch.object(
-                orchestrator.run_quality, "execute", new_callable=AsyncMock
-            ) as mock_quality,
-            patch.object(orchestrator.finalize, "execute", new_callable=AsyncMock) as mock_finalize,
+        with stub_use_cases(
+            orchestrator, approve_conditions=True, approve_plan=False, finalize=blocked
         ):
-            mock_finalize.return_value = FinalResult(
-                task_id=task.id,
-                status=TaskStatus.DONE,
-                diff="",
-                patch="",
-                summary="Done",
-                conditions=[],
-                evidence_refs=[],
-            )
-
-            await orchestrator._continue_from_delivery(task, task_input)
+            result = await orchestrator._continue_from_approval(task, task_input)
 
-            # Should not execute since task is already done
-            mock_exec.assert_not_called()
-            mock_quality.assert_called_once()
+            assert task.status == TaskStatus.BLOCKED
+            assert result.status == TaskStatus.BLOCKED
 
     @pytest.mark.asyncio
-    async def test_continue_from_delivery_budget_exhausted(
-        self, orchestrator, task_input, tmp_path
-    ):
-        """_continue_from_delivery should skip execution if budget
-        exhausted."""
+    async def test_continue_from_approval_success(self, orchestrator, task_input, tmp_path_str):
+        """_continue_from_approval should continue to delivery if approved."""
         task = Task(
             id=uuid4(),
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
-            budget=Budget(max_iterations=10, iteration_count=10),
+            sources=[tmp_path_str],
         )
 
         with (
+            stub_use_cases(orchestrator, approve_conditions=True, approve_plan=True),
             patch.object(
-                orchestrator.execute_delivery, "execute", new_callable=AsyncMock
-            ) as mock_exec,
-            patch.object(orchestrator.finalize, "execute", new_callable=AsyncMock) as mock_finalize,
-        ):
-            mock_finalize.return_value = FinalResult(
-                task_id=task.id,
-                status=TaskStatus.STOPPED,
-                diff="",
-                patch="",
-                summary="Stopped",
-                conditions=[],
-                evidence_refs=[],
-            )
-
-            await orchestrator._continue_from_delivery(task, task_input)
-
-            mock_exec.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_continue_from_delivery_starts_budget_tracking(
-        self, orchestrator, task_input, tmp_path
-    ):
-        """_continue_from_delivery should start budget tracking if not
-        started."""
-        task = Task(
-            id=uuid4(),
-            description="Test",
-            goals=["Goal"],
-            sources=[str(tmp_path)],
-            budget=Budget(max_iterations=10),
-        )
-        task.budget.start_timestamp = 0  # Not started
-
-        # Add a failing condition so delivery actually runs
-        cond = Condition(
-            id=uuid4(),
-            description="Test",
-            role=ConditionRole.BLOCKING,
-        )
-        cond.check_status = CheckStatus.FAIL  # Failing initially
-        task.conditions = [cond]
-
-        call_count = 0
-
-        async def mock_execute(*_args, **_kwargs):
-            nonlocal call_count
-            call_count += 1
-            # After first execution, mark condition as passed
-            cond.check_status = CheckStatus.PASS
-            cond.approve()
-            cond.evidence_ref = MagicMock()
-            return Iteration(
-                number=call_count,
-                goal="Test",
-                changes=["file.py"],
-                check_results={},
-                decision=IterationDecision.DONE,
-                decision_reason="Done",
-                timestamp=datetime.now(UTC),
-            )
-
-        with (
-            patch.object(orchestrator.execute_delivery, "execute", side_effect=mock_execute),
-            patch.object(orchestrator.run_quality, "execute", new_callable=AsyncMock),
-            patch.object(orchestrator.finalize, "execute", new_callable=AsyncMock) as mock_finalize,
+                orchestrator, "_continue_from_delivery", new_callable=AsyncMock
+            ) as mock_continue,
         ):
-            mock_finalize.return_value = FinalResult(
+            mock_continue.return_value = FinalResult(
                 task_id=task.id,
                 status=TaskStatus.DONE,
                 diff="",
@@ -1092,354 +891,7 @@ class TestContinueFromDelivery:
                 evidence_refs=[],
             )
 
-            await orchestrator._continue_from_delivery(task, task_input)
-
-            # Budget tracking should have started
-            assert task.budget.start_timestamp > 0
-
-
-class TestRunWithCallbacks:
-    @pytest.mark.asyncio
-    async def test_run_with_plan_and_conditions_callback(self, orchestrator, tmp_path):
-        """Run() should handle plan_and_conditions_callback."""
-        task_input = TaskInput(
-            description="Test",
-            goals=["Goal"],
-            workspace_path=tmp_path,
-            auto_approve=False,  # Not auto-approve to trigger callback
-        )
-
-        callback_called = False
-
-        def plan_callback(_plan, conditions):
-            nonlocal callback_called
-            callback_called = True
-            return (True, None, conditions)  # Approve
-
-        with patch.object(
-            orchestrator.multi_repo_manager, "discover_repos", new_callable=AsyncMock
-        ) as mock_discover:
-            mock_discover.return_value = WorkspaceInfo(
-                is_workspace=False, repos=[tmp_path], root=tmp_path
-            )
-
-            task = Task(
-                id=uuid4(),
-                description="Test",
-                goals=["Goal"],
-                sources=[str(tmp_path)],
-                budget=Budget(max_iterations=10),
-            )
-
-            with patch.object(
-                orchestrator.intake, "execute", new_callable=AsyncMock
-            ) as mock_intake:
-                mock_intake.return_value = task
-
-                with (
-                    patch.object(orchestrator.build_inventory, "execute", new_callable=AsyncMock),
-                    patch.object(orchestrator.create_plan, "execute", new_callable=AsyncMock),
-                ):
-                    task.plan = Plan(
-                        goal="Test",
-                        boundaries=[],
-                        steps=[PlanStep(number=1, description="Step")],
-                    )
-
-                    with patch.object(
-                        orchestrator.execute_delivery, "execute", new_callable=AsyncMock
-                    ) as mock_exec:
-                        iteration = Iteration(
-                            number=1,
-                            goal="Test",
-                            changes=["file.py"],
-                            check_results={},
-                            decision=IterationDecision.DONE,
-                            decision_reason="Done",
-                            timestamp=datetime.now(UTC),
-                        )
-                        mock_exec.return_value = iteration
-
-                        # Mark task as done
-                        cond = Condition(
-                            id=uuid4(),
-                            description="Test",
-                            role=ConditionRole.BLOCKING,
-                        )
-                        cond.check_status = CheckStatus.PASS
-                        cond.approve()
-                        cond.evidence_ref = MagicMock()
-                        task.conditions = [cond]
-
-                        with patch.object(
-                            orchestrator.finalize, "execute", new_callable=AsyncMock
-                        ) as mock_finalize:
-                            mock_finalize.return_value = FinalResult(
-                                task_id=task.id,
-                                status=TaskStatus.DONE,
-                                diff="",
-                                patch="",
-                                summary="Done",
-                                conditions=[],
-                                evidence_refs=[],
-                            )
-
-                            await orchestrator.run(
-                                task_input,
-                                callbacks=OrchestrationCallbacks(plan_and_conditions=plan_callback),
-                            )
-
-                            assert callback_called
-
-    @pytest.mark.asyncio
-    async def test_run_with_plan_callback_refine(self, orchestrator, tmp_path):
-        """Run() should refine plan when callback provides feedback."""
-        task_input = TaskInput(
-            description="Test",
-            goals=["Goal"],
-            workspace_path=tmp_path,
-            auto_approve=False,
-        )
-
-        call_count = 0
-
-        def plan_callback(_plan, conditions):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return (False, "Add more detail", conditions)  # Reject with feedback
-            return (True, None, conditions)  # Approve on second call
-
-        with patch.object(
-            orchestrator.multi_repo_manager, "discover_repos", new_callable=AsyncMock
-        ) as mock_discover:
-            mock_discover.return_value = WorkspaceInfo(
-                is_workspace=False, repos=[tmp_path], root=tmp_path
-            )
-
-            task = Task(
-                id=uuid4(),
-                description="Test",
-                goals=["Goal"],
-                sources=[str(tmp_path)],
-            )
-
-            with patch.object(
-                orchestrator.intake, "execute", new_callable=AsyncMock
-            ) as mock_intake:
-                mock_intake.return_value = task
-
-                with (
-                    patch.object(orchestrator.build_inventory, "execute", new_callable=AsyncMock),
-                    patch.object(orchestrator.create_plan, "execute", new_callable=AsyncMock),
-                ):
-                    task.plan = Plan(
-                        goal="Test",
-                        boundaries=[],
-                        steps=[PlanStep(number=1, description="Step")],
-                    )
-
-                    with patch.object(
-                        orchestrator.create_plan, "refine", new_callable=AsyncMock
-                    ) as mock_refine:
-                        mock_refine.return_value = task.plan
-
-                        with patch.object(
-                            orchestrator.execute_delivery,
-                            "execute",
-                            new_callable=AsyncMock,
-                        ) as mock_exec:
-                            iteration = Iteration(
-                                number=1,
-                                goal="Test",
-                                changes=["file.py"],
-                                check_results={},
-                                decision=IterationDecision.DONE,
-                                decision_reason="Done",
-                                timestamp=datetime.now(UTC),
-                            )
-                            mock_exec.return_value = iteration
-
-                            cond = Condition(
-                                id=uuid4(),
-                                description="Test",
-                                role=ConditionRole.BLOCKING,
-                            )
-                            cond.check_status = CheckStatus.PASS
-                            cond.approve()
-                            cond.evidence_ref = MagicMock()
-                            task.conditions = [cond]
-
-                            with patch.object(
-                                orchestrator.finalize,
-                                "execute",
-                                new_callable=AsyncMock,
-                            ) as mock_finalize:
-                                mock_finalize.return_value = FinalResult(
-                                    task_id=task.id,
-                                    status=TaskStatus.DONE,
-                                    diff="",
-                                    patch="",
-                                    summary="Done",
-                                    conditions=[],
-                                    evidence_refs=[],
-                                )
-
-                                await orchestrator.run(
-                                    task_input,
-                                    callbacks=OrchestrationCallbacks(
-                                        plan_and_conditions=plan_callback
-                                    ),
-                                )
-
-                                # refine should have been called once
-                                mock_refine.assert_called_once()
-                                assert call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_run_with_deprecated_plan_approval_callback(self, orchestrator, tmp_path):
-        """Run() should handle deprecated plan_approval_callback."""
-        task_input = TaskInput(
-            description="Test",
-            goals=["Goal"],
-            workspace_path=tmp_path,
-            auto_approve=False,
-        )
-
-        def deprecated_callback(_plan):
-            return (True, None)  # Approve
-
-        with patch.object(
-            orchestrator.multi_repo_manager, "discover_repos", new_callable=AsyncMock
-        ) as mock_discover:
-            mock_discover.return_value = WorkspaceInfo(
-                is_workspace=False, repos=[tmp_path], root=tmp_path
-            )
-
-            task = Task(
-                id=uuid4(),
-                description="Test",
-                goals=["Goal"],
-                sources=[str(tmp_path)],
-            )
-
-            with patch.object(
-                orchestrator.intake, "execute", new_callable=AsyncMock
-            ) as mock_intake:
-                mock_intake.return_value = task
-
-                with (
-                    patch.object(orchestrator.build_inventory, "execute", new_callable=AsyncMock),
-                    patch.object(orchestrator.create_plan, "execute", new_callable=AsyncMock),
-                ):
-                    task.plan = Plan(
-                        goal="Test",
-                        boundaries=[],
-                        steps=[PlanStep(number=1, description="Step")],
-                    )
-
-                    with patch.object(
-                        orchestrator.execute_delivery, "execute", new_callable=AsyncMock
-                    ) as mock_exec:
-                        iteration = Iteration(
-                            number=1,
-                            goal="Test",
-                            changes=["file.py"],
-                            check_results={},
-                            decision=IterationDecision.DONE,
-                            decision_reason="Done",
-                            timestamp=datetime.now(UTC),
-                        )
-                        mock_exec.return_value = iteration
-
-                        cond = Condition(
-                            id=uuid4(),
-                            description="Test",
-                            role=ConditionRole.BLOCKING,
-                        )
-                        cond.check_status = CheckStatus.PASS
-                        cond.approve()
-                        cond.evidence_ref = MagicMock()
-                        task.conditions = [cond]
-
-                        with patch.object(
-                            orchestrator.finalize, "execute", new_callable=AsyncMock
-                        ) as mock_finalize:
-                            mock_finalize.return_value = FinalResult(
-                                task_id=task.id,
-                                status=TaskStatus.DONE,
-                                diff="",
-                                patch="",
-                                summary="Done",
-                                conditions=[],
-                                evidence_refs=[],
-                            )
-
-                            result = await orchestrator.run(
-                                task_input,
-                                callbacks=OrchestrationCallbacks(plan_approval=deprecated_callback),
-                            )
-
-                            assert result.status == TaskStatus.DONE
-
-    @pytest.mark.asyncio
-    async def test_run_plan_rejected_without_feedback(self, orchestrator, tmp_path):
-        """Run() should block when plan rejected without feedback."""
-        task_input = TaskInput(
-            description="Test",
-            goals=["Goal"],
-            workspace_path=tmp_path,
-            auto_approve=False,
-        )
-
-        def reject_callback(_plan, conditions):
-            return (False, None, conditions)  # Reject without feedback
-
-        with patch.object(
-            orchestrator.multi_repo_manager, "discover_repos", new_callable=AsyncMock
-        ) as mock_discover:
-            mock_discover.return_value = WorkspaceInfo(
-                is_workspace=False, repos=[tmp_path], root=tmp_path
-            )
-
-            task = Task(
-                id=uuid4(),
-                description="Test",
-                goals=["Goal"],
-                sources=[str(tmp_path)],
-            )
-
-            with patch.object(
-                orchestrator.intake, "execute", new_callable=AsyncMock
-            ) as mock_intake:
-                mock_intake.return_value = task
-
-                with (
-                    patch.object(orchestrator.build_inventory, "execute", new_callable=AsyncMock),
-                    patch.object(orchestrator.create_plan, "execute", new_callable=AsyncMock),
-                ):
-                    task.plan = Plan(
-                        goal="Test",
-                        boundaries=[],
-                        steps=[PlanStep(number=1, description="Step")],
-                    )
-
-                    with patch.object(
-                        orchestrator.finalize, "execute", new_callable=AsyncMock
-                    ) as mock_finalize:
-                        mock_finalize.return_value = FinalResult(
-                            task_id=task.id,
-                            status=TaskStatus.BLOCKED,
-                            diff="",
-                            patch="",
-                            summary="Blocked",
-                            conditions=[],
-                            evidence_refs=[],
-                        )
-
-                        result = await orchestrator.run(
-                            task_input,
-                            callbacks=OrchestrationCallbacks(plan_and_conditions=reject_callback),
-                        )
+            result = await orchestrator._continue_from_approval(task, task_input)
 
-                        assert result.status == TaskStatus.BLOCKED
+            mock_continue.assert_called_once()
+            assert result.status == TaskStatus.DONE
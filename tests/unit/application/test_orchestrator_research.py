@@ -1,5 +1,7 @@
 """Unit tests for Orchestrator.run_research method and ResearchTaskInput."""
 
+import pytest
+
 from src.application.research_orchestrator import ResearchTaskInput
 from src.domain.value_objects import ReportPackTemplate, ResearchPreset, ResearchType
 
@@ -34,18 +36,6 @@ class TestResearchTaskInput:
         assert input_obj.auto_approve is True
         assert input_obj.template == ReportPackTemplate.GENERAL_DEFAULT
 
-    def test_research_task_input_minimal_preset(self, tmp_path):
-        """ResearchTaskInput should accept minimal preset."""
-        input_obj = ResearchTaskInput(
-            description="Quick research",
-            workspace_path=tmp_path,
-            preset=ResearchPreset.MINIMAL,
-            research_type=ResearchType.GENERAL,
-        )
-
-        assert input_obj.preset == ResearchPreset.MINIMAL
-        assert input_obj.research_type == ResearchType.GENERAL
-
     def test_research_task_input_inherits_from_task_input(self, tmp_path):
         """ResearchTaskInput should inherit TaskInput fields."""
         input_obj = ResearchTaskInput(
@@ -71,32 +61,22 @@ class TestResearchTaskInput:
 
         assert len(input_obj.sources) == 2
 
-    def test_research_task_input_thorough_preset(self, tmp_path):
-        """ResearchTaskInput should accept thorough preset."""
+    @pytest.mark.parametrize(
+        ("kwargs", "attr", "expected"),
+        [
+            ({"preset": ResearchPreset.MINIMAL}, "preset", ResearchPreset.MINIMAL),
+            ({"preset": ResearchPreset.THOROUGH}, "preset", ResearchPreset.THOROUGH),
+            ({"research_type": ResearchType.GENERAL}, "research_type", ResearchType.GENERAL),
+            ({"research_type": ResearchType.ACADEMIC}, "research_type", ResearchType.ACADEMIC),
+            ({"research_type": ResearchType.MARKET}, "research_type", ResearchType.MARKET),
+        ],
+    )
+    def test_research_task_input_accepts_field(self, tmp_path, kwargs, attr, expected):
+        """ResearchTaskInput should accept each preset and research type."""
         input_obj = ResearchTaskInput(
-            description="Deep research",
-            workspace_path=tmp_path,
-            preset=ResearchPreset.THOROUGH,
-        )
-
-        assert input_obj.preset == ResearchPreset.THOROUGH
-
-    def test_research_task_input_academic_type(self, tmp_path):
-        """ResearchTaskInput should accept academic research type."""
-        input_obj = ResearchTaskInput(
-            description="Academic research on X",
-            workspace_path=tmp_path,
-            research_type=ResearchType.ACADEMIC,
-        )
-
-        assert input_obj.research_type == ResearchType.ACADEMIC
-
-    def test_research_task_input_market_type(self, tmp_path):
-        """ResearchTaskInput should accept market research type."""
-        input_obj = ResearchTaskInput(
-            description="Market analysis for X",
+            description="Test research",
             workspace_path=tmp_path,
-            research_type=ResearchType.MARKET,
+            **kwargs,
         )
 
-        assert input_obj.research_type == ResearchType.MARKET
+        assert getattr(input_obj, attr) == expected
@@ -1,6 +1,9 @@
 """Tests for ResearchTaskInput."""
 
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 from src.application.research_orchestrator import ResearchTaskInput
 from src.domain.value_objects.report_pack_template import ReportPackTemplate
@@ -19,46 +22,40 @@ class TestResearchTaskInput:
         assert input_.template == ReportPackTemplate.GENERAL_DEFAULT
         assert input_.repo_context == "off"
 
-    def test_custom_research_type(self, tmp_path: Path) -> None:
-        input_ = ResearchTaskInput(
-            description="Research topic",
-            workspace_path=tmp_path,
-            research_type=ResearchType.TECHNICAL,
-        )
-        assert input_.research_type == ResearchType.TECHNICAL
-
-    def test_custom_preset(self, tmp_path: Path) -> None:
-        input_ = ResearchTaskInput(
-            description="Research topic",
-            workspace_path=tmp_path,
-            preset=ResearchPreset.MINIMAL,
-        )
-        assert input_.preset == ResearchPreset.MINIMAL
-
-    def test_custom_template(self, tmp_path: Path) -> None:
+    @pytest.mark.parametrize(
+        ("kwargs", "attr", "expected"),
+        [
+            (
+                {"research_type": ResearchType.TECHNICAL},
+                "research_type",
+                ResearchType.TECHNICAL,
+            ),
+            ({"preset": ResearchPreset.MINIMAL}, "preset", ResearchPreset.MINIMAL),
+            (
+                {"template": ReportPackTemplate.TECHNICAL_BEST_PRACTICES},
+                "template",
+                ReportPackTemplate.TECHNICAL_BEST_PRACTICES,
+            ),
+            ({"repo_context": "off"}, "repo_context", "off"),
+            ({"repo_context": "light"}, "repo_context", "light"),
+            ({"repo_context": "full"}, "repo_context", "full"),
+            ({"baseline": True}, "baseline", True),
+            (
+                {"goals": ["Custom goal 1", "Custom goal 2"]},
+                "goals",
+                ["Custom goal 1", "Custom goal 2"],
+            ),
+        ],
+    )
+    def test_custom_field(
+        self, tmp_path: Path, kwargs: dict[str, Any], attr: str, expected: Any
+    ) -> None:
         input_ = ResearchTaskInput(
             description="Research topic",
             workspace_path=tmp_path,
-            template=ReportPackTemplate.TECHNICAL_BEST_PRACTICES,
+            **kwargs,
         )
-        assert input_.template == ReportPackTemplate.TECHNICAL_BEST_PRACTICES
-
-    def test_repo_context_modes(self, tmp_path: Path) -> None:
-        for mode in ["off", "light", "full"]:
-            input_ = ResearchTaskInput(
-                description="Research topic",
-                workspace_path=tmp_path,
-                repo_context=mode,
-            )
-            assert input_.repo_context == mode
-
-    def test_baseline_enabled(self, tmp_path: Path) -> None:
-        input_ = ResearchTaskInput(
-            description="Research topic",
-            workspace_path=tmp_path,
-            baseline=True,
-        )
-        assert input_.baseline is True
+        assert getattr(input_, attr) == expected
 
     def test_goals_default_to_description(self, tmp_path: Path) -> None:
         input_ = ResearchTaskInput(
@@ -84,11 +81,3 @@ class TestResearchTaskInput:
         assert input_.description == "Research topic"
         assert input_.auto_approve is True
         assert input_.timeout_minutes == 60
-
-    def test_with_custom_goals(self, tmp_path: Path) -> None:
-        input_ = ResearchTaskInput(
-            description="Research topic",
-            workspace_path=tmp_path,
-            goals=["Custom goal 1", "Custom goal 2"],
-        )
-        assert input_.goals == ["Custom goal 1", "Custom goal 2"]
@@ -1,6 +1,6 @@
 """Tests for SelectMCPServers use case."""
 
-from unittest.mock import AsyncMock
+from typing import Any
 from uuid import uuid4
 
 import pytest
@@ -17,7 +17,38 @@ from src.domain.value_objects.mcp_types import (
 )
 
 
-@pytest.fixture
+def _agent_result(final_response: str) -> AgentResult:
+    return AgentResult(messages=[], final_response=final_response, tools_used=["Read"])
+
+
+# Agent responses are only read by SelectMCPServers, so tests share them.
+_RESULT_SINGLE = _agent_result(
+    '```json\n[{"name": "playwright", "reason": "Browser testing", "confidence": 0.9}]\n```'
+)
+_RESULT_MULTI = _agent_result(
+    """```json
+[
+    {"name": "playwright", "reason": "Browser testing", "confidence": 0.9},
+    {"name": "github", "reason": "GitHub access needed", "confidence": 0.7}
+]
+```"""
+)
+_RESULT_EMPTY = _agent_result("```json\n[]\n```")
+_RESULT_NOT_JSON = _agent_result("This is not JSON")
+_RESULT_UNKNOWN = _agent_result(
+    '```json\n[{"name": "unknown-server", "reason": "Test", "confidence": 0.8}]\n```'
+)
+_RESULT_MIXED = _agent_result(
+    """```json
+[
+    {"name": "playwright", "reason": "Known server", "confidence": 0.9},
+    {"name": "unknown", "reason": "Unknown server", "confidence": 0.8}
+]
+```"""
+)
+
+
+@pytest.fixture(scope="module")
 def sample_registry() -> MCPServerRegistry:
     """Create a sample MCP registry."""
     registry = MCPServerRegistry()
@@ -43,7 +74,7 @@ def sample_registry() -> MCPServerRegistry:
     return registry
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_task() -> Task:
     """Create a sample task."""
     return Task(
@@ -55,11 +86,20 @@ def sample_task() -> Task:
     )
 
 
+class _StubAgent:
+    """Agent stand-in that returns a preset result from execute()."""
+
+    def __init__(self) -> None:
+        self.execute_result: AgentResult | None = None
+
+    async def execute(self, *args: Any, **kwargs: Any) -> AgentResult | None:
+        return self.execute_result
+
+
 @pytest.fixture
-def mock_agent() -> AsyncMock:
-    """Create a mock agent."""
-    agent = AsyncMock()
-    return agent
+def mock_agent() -> _StubAgent:
+    """Create a stub agent."""
+    return _StubAgent()
 
 
 class TestMCPSuggestion:
@@ -104,140 +144,38 @@ class TestMCPSuggestion:
 class TestSelectMCPServers:
     """Tests for SelectMCPServers use case."""
 
-    @pytest.mark.asyncio
-    async def test_analyze_returns_suggestions(
-        self,
-        mock_agent: AsyncMock,
-        sample_registry: MCPServerRegistry,
-        sample_task: Task,
-    ) -> None:
-        """Test analyzing task returns suggestions."""
-        mock_agent.execute.return_value = AgentResult(
-            messages=[],
-            final_response='```json\n[{"name": "playwright", "reason": "Browser testing", "confidence": 0.9}]\n```',
-            tools_used=["Read"],
-        )
-
-        use_case = SelectMCPServers(mock_agent, sample_registry)
-        suggestions = await use_case.analyze_and_suggest(sample_task)
-
-        assert len(suggestions) == 1
-        assert suggestions[0].server_name == "playwright"
-        assert suggestions[0].confidence == 0.9
-
-    @pytest.mark.asyncio
-    async def test_analyze_with_multiple_suggestions(
-        self,
-        mock_agent: AsyncMock,
-        sample_registry: MCPServerRegistry,
-        sample_task: Task,
-    ) -> None:
-        """Test analyzing task with multiple suggestions."""
-        mock_agent.execute.return_value = AgentResult(
-            messages=[],
-            final_response="""```json
-[
-    {"name": "playwright", "reason": "Browser testing", "confidence": 0.9},
-    {"name": "github", "reason": "GitHub access needed", "confidence": 0.7}
-]
-```""",
-            tools_used=["Read"],
-        )
-
-        use_case = SelectMCPServers(mock_agent, sample_registry)
-        suggestions = await use_case.analyze_and_suggest(sample_task)
-
-        assert len(suggestions) == 2
-        assert suggestions[0].server_name == "playwright"
-        assert suggestions[1].server_name == "github"
-
-    @pytest.mark.asyncio
-    async def test_analyze_empty_suggestions(
-        self,
-        mock_agent: AsyncMock,
-        sample_registry: MCPServerRegistry,
-        sample_task: Task,
-    ) -> None:
-        """Test analyzing task with no suggestions."""
-        mock_agent.execute.return_value = AgentResult(
-            messages=[],
-            final_response="```json\n[]\n```",
-            tools_used=["Read"],
-        )
-
-        use_case = SelectMCPServers(mock_agent, sample_registry)
-        suggestions = await use_case.analyze_and_suggest(sample_task)
-
-        assert len(suggestions) == 0
-
-    @pytest.mark.asyncio
-    async def test_analyze_invalid_json(
-        self,
-        mock_agent: AsyncMock,
-        sample_registry: MCPServerRegistry,
-        sample_task: Task,
-    ) -> None:
-        """Test handling invalid JSON response."""
-        mock_agent.execute.return_value = AgentResult(
-            messages=[],
-            final_response="This is not JSON",
-            tools_used=["Read"],
-        )
-
-        use_case = SelectMCPServers(mock_agent, sample_registry)
-        suggestions = await use_case.analyze_and_suggest(sample_task)
-
-        assert len(suggestions) == 0
-
-    @pytest.mark.asyncio
-    async def test_analyze_unknown_server(
-        self,
-        mock_agent: AsyncMock,
-        sample_registry: MCPServerRegistry,
-        sample_task: Task,
-    ) -> None:
-        """Test handling suggestions for unknown servers."""
-        mock_agent.execute.return_value = AgentResult(
-            messages=[],
-            final_response='```json\n[{"name": "unknown-server", "reason": "Test", "confidence": 0.8}]\n```',
-            tools_used=["Read"],
-        )
-
-        use_case = SelectMCPServers(mock_agent, sample_registry)
-        suggestions = await use_case.analyze_and_suggest(sample_task)
-
-        # Unknown server should be filtered out
-        assert len(suggestions) == 0
-
-    @pytest.mark.asyncio
-    async def test_analyze_mixed_known_unknown(
+    @pytest.mark.parametrize(
+        ("agent_result", "expected"),
+        [
+            (_RESULT_SINGLE, [("playwright", 0.9)]),
+            (_RESULT_MULTI, [("playwright", 0.9), ("github", 0.7)]),
+            (_RESULT_EMPTY, []),
+            (_RESULT_NOT_JSON, []),
+            # Unknown servers are filtered out
+            (_RESULT_UNKNOWN, []),
+            (_RESULT_MIXED, [("playwright", 0.9)]),
+        ],
+        ids=["single", "multi", "empty", "invalid", "unknown", "mixed"],
+    )
+    async def test_analyze(
         self,
-        mock_agent: AsyncMock,
+        mock_agent: _StubAgent,
         sample_registry: MCPServerRegistry,
         sample_task: Task,
+        agent_result: AgentResult,
+        expected: list[tuple[str, float]],
     ) -> None:
-        """Test handling mix of known and unknown servers."""
-        mock_agent.execute.return_value = AgentResult(
-            messages=[],
-            final_response="""```json
-[
-    {"name": "playwright", "reason": "Known server", "confidence": 0.9},
-    {"name": "unknown", "reason": "Unknown server", "confidence": 0.8}
-]
-```""",
-            tools_used=["Read"],
-        )
+        """Test analyzing task returns suggestions for known servers only."""
+        mock_agent.execute_result = agent_result
 
         use_case = SelectMCPServers(mock_agent, sample_registry)
         suggestions = await use_case.analyze_and_suggest(sample_task)
 
-        # Only known server should be returned
-        assert len(suggestions) == 1
-        assert suggestions[0].server_name == "playwright"
+        assert [(s.server_name, s.confidence) for s in suggestions] == expected
 
     def test_get_template(
         self,
-        mock_agent: AsyncMock,
+        mock_agent: _StubAgent,
         sample_registry: MCPServerRegistry,
     ) -> None:
         """Test getting template by name."""
@@ -252,7 +190,7 @@ class TestSelectMCPServers:
 
     def test_list_available(
         self,
-        mock_agent: AsyncMock,
+        mock_agent: _StubAgent,
         sample_registry: MCPServerRegistry,
     ) -> None:
         """Test listing all available templates."""
@@ -263,7 +201,7 @@ class TestSelectMCPServers:
 
     def test_list_by_category(
         self,
-        mock_agent: AsyncMock,
+        mock_agent: _StubAgent,
         sample_registry: MCPServerRegistry,
     ) -> None:
         """Test listing templates by category."""
@@ -1,5 +1,6 @@
 """Tests for StagnationDetector service."""
 
+from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
 import pytest
@@ -9,7 +10,7 @@ from src.domain.entities.iteration import Iteration, IterationDecision
 from src.domain.value_objects.condition_enums import CheckStatus
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def detector() -> StagnationDetector:
     return StagnationDetector(limit=3)
 
@@ -17,6 +18,7 @@ def detector() -> StagnationDetector:
 # Use fixed UUIDs for testing
 TEST_CHECK_ID = uuid4()
 TEST_CHECK_ID2 = uuid4()
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
 
 
 def make_iteration(
@@ -32,43 +34,51 @@ def make_iteration(
         check_results=check_results or {},
         decision=IterationDecision.CONTINUE,
         decision_reason="test",
+        timestamp=_FIXED_TS,
     )
 
 
+@pytest.fixture
+def stagnant_iterations() -> list[Iteration]:
+    return [make_iteration(i, changes=[]) for i in (1, 2, 3)]
+
+
+@pytest.fixture
+def improving_iterations() -> list[Iteration]:
+    return [
+        make_iteration(1, changes=[], check_results={TEST_CHECK_ID: CheckStatus.FAIL}),
+        make_iteration(2, changes=[], check_results={TEST_CHECK_ID: CheckStatus.PASS}),
+        make_iteration(3, changes=[], check_results={TEST_CHECK_ID: CheckStatus.PASS}),
+    ]
+
+
 class TestIsStagnating:
     """Tests for is_stagnating method."""
 
-    def test_not_stagnating_with_few_iterations(self, detector: StagnationDetector) -> None:
+    def test_not_stagnating_with_few_iterations(
+        self, detector: StagnationDetector, stagnant_iterations: list[Iteration]
+    ) -> None:
         """Test not stagnating when less than limit iterations."""
-        iterations = [make_iteration(1), make_iteration(2)]
-        assert detector.is_stagnating(iterations) is False
+        assert detector.is_stagnating(stagnant_iterations[:2]) is False
 
-    def test_not_stagnating_with_recent_changes(self, detector: StagnationDetector) -> None:
+    def test_not_stagnating_with_recent_changes(
+        self, detector: StagnationDetector, stagnant_iterations: list[Iteration]
+    ) -> None:
         """Test not stagnating when recent iterations have changes."""
-        iterations = [
-            make_iteration(1, changes=[]),
-            make_iteration(2, changes=[]),
-            make_iteration(3, changes=["file.py"]),
-        ]
+        iterations = [*stagnant_iterations[:2], make_iteration(3, changes=["file.py"])]
         assert detector.is_stagnating(iterations) is False
 
-    def test_stagnating_with_no_changes(self, detector: StagnationDetector) -> None:
+    def test_stagnating_with_no_changes(
+        self, detector: StagnationDetector, stagnant_iterations: list[Iteration]
+    ) -> None:
         """Test stagnating when no recent changes."""
-        iterations = [
-            make_iteration(1, changes=[]),
-            make_iteration(2, changes=[]),
-            make_iteration(3, changes=[]),
-        ]
-        assert detector.is_stagnating(iterations) is True
+        assert detector.is_stagnating(stagnant_iterations) is True
 
-    def test_not_stagnating_with_check_improvement(self, detector: StagnationDetector) -> None:
+    def test_not_stagnating_with_check_improvement(
+        self, detector: StagnationDetector, improving_iterations: list[Iteration]
+    ) -> None:
         """Test not stagnating when check improves from fail to pass."""
-        iterations = [
-            make_iteration(1, changes=[], check_results={TEST_CHECK_ID: CheckStatus.FAIL}),
-            make_iteration(2, changes=[], check_results={TEST_CHECK_ID: CheckStatus.PASS}),
-            make_iteration(3, changes=[], check_results={TEST_CHECK_ID: CheckStatus.PASS}),
-        ]
-        assert detector.is_stagnating(iterations) is False
+        assert detector.is_stagnating(improving_iterations) is False
 
 
 class TestGetStagnationCount:
@@ -104,37 +114,31 @@ class TestGetStagnationCount:
 class TestHasCheckImprovement:
     """Tests for _has_check_improvement method."""
 
-    def test_improvement_from_fail_to_pass(self, detector: StagnationDetector) -> None:
-        """Test detecting improvement from fail to pass."""
-        iterations = [
-            make_iteration(1, check_results={TEST_CHECK_ID: CheckStatus.FAIL}),
-            make_iteration(2, check_results={TEST_CHECK_ID: CheckStatus.PASS}),
-        ]
-        assert detector._has_check_improvement(iterations, iterations[1]) is True
-
-    def test_no_improvement_both_fail(self, detector: StagnationDetector) -> None:
-        """Test no improvement when both fail."""
-        iterations = [
-            make_iteration(1, check_results={TEST_CHECK_ID: CheckStatus.FAIL}),
-            make_iteration(2, check_results={TEST_CHECK_ID: CheckStatus.FAIL}),
-        ]
-        assert detector._has_check_improvement(iterations, iterations[1]) is False
-
-    def test_no_improvement_first_iteration(self, detector: StagnationDetector) -> None:
-        """Test no improvement possible for first iteration."""
-        iterations = [
-            make_iteration(1, check_results={TEST_CHECK_ID: CheckStatus.PASS}),
-        ]
-        assert detector._has_check_improvement(iterations, iterations[0]) is False
-
-    def test_improvement_with_new_check(self, detector: StagnationDetector) -> None:
-        """Test no improvement when check is new."""
-        iterations = [
-            make_iteration(1, check_results={}),
-            make_iteration(2, check_results={TEST_CHECK_ID: CheckStatus.PASS}),
-        ]
-        # New check passing is not considered improvement from fail
-        assert detector._has_check_improvement(iterations, iterations[1]) is False
+    @pytest.mark.parametrize(
+        ("prev_results", "curr_results", "expected"),
+        [
+            ({TEST_CHECK_ID: CheckStatus.FAIL}, {TEST_CHECK_ID: CheckStatus.PASS}, True),
+            ({TEST_CHECK_ID: CheckStatus.FAIL}, {TEST_CHECK_ID: CheckStatus.FAIL}, False),
+            (None, {TEST_CHECK_ID: CheckStatus.PASS}, False),
+            # New check passing is not considered improvement from fail
+            ({}, {TEST_CHECK_ID: CheckStatus.PASS}, False),
+        ],
+        ids=["fail-to-pass", "both-fail", "first-iteration", "new-check"],
+    )
+    def test_check_improvement(
+        self,
+        detector: StagnationDetector,
+        prev_results: dict[UUID, CheckStatus] | None,
+        curr_results: dict[UUID, CheckStatus],
+        expected: bool,
+    ) -> None:
+        """Test improvement is only a check going from fail to pass."""
+        current = make_iteration(2, check_results=curr_results)
+        if prev_results is None:
+            iterations = [current]
+        else:
+            iterations = [make_iteration(1, check_results=prev_results), current]
+        assert detector._has_check_improvement(iterations, current) is expected
 
 
 class TestHasAnyPass:
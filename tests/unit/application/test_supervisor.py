@@ -1,5 +1,8 @@
+import functools
 from datetime import UTC, datetime
-from uuid import uuid4
+from uuid import UUID
+
+import pytest
 
 from src.application.services.supervisor import Supervisor
 from src.domain.entities.budget import Budget
@@ -13,75 +16,115 @@ from src.domain.value_objects.supervision_enums import (
     SupervisionDecision,
 )
 
+_TASK_ID = UUID(int=0xA)
+_CHECK_ID_1 = UUID(int=0x1)
+_CHECK_ID_2 = UUID(int=0x2)
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
+# Iteration validation copies the list, so no iteration aliases this constant.
+_CHANGED_FILES = ["file.py"]
+
+_make_iteration = functools.partial(
+    Iteration,
+    decision=IterationDecision.CONTINUE,
+    decision_reason="",
+    timestamp=_FIXED_TS,
+)
+
+# Validated once; _run_failures stamps number, goal and check_results onto copies.
+_FAILED_ITERATION = _make_iteration(
+    number=0,
+    goal="",
+    changes=_CHANGED_FILES,
+    decision_reason="Check failed",
+)
+
 
 def _make_task_with_conditions(
     check_results: dict,
     max_iterations: int = 50,
 ) -> Task:
     """Create a task with conditions matching check_results."""
-    task = Task(
-        id=uuid4(),
+    return Task(
+        id=_TASK_ID,
         description="Test task",
         goals=[],
         sources=["."],
         budget=Budget(max_iterations=max_iterations),
+        # One blocking condition per check_id, already in its check status
+        conditions=[
+            Condition(
+                id=check_id,
+                description=f"Test condition {check_id}",
+                role=ConditionRole.BLOCKING,
+                check_status=status,
+            )
+            for check_id, status in check_results.items()
+        ],
     )
-    # Create conditions for each check_id
-    for check_id, status in check_results.items():
-        condition = Condition(
-            id=check_id,
-            description=f"Test condition {check_id}",
-            role=ConditionRole.BLOCKING,
-        )
-        condition.check_status = status
-        task.conditions.append(condition)
-    return task
 
 
-def test_supervisor_continue_on_progress():
-    supervisor = Supervisor()
+@pytest.fixture
+def supervisor():
+    """Default-config Supervisor. Tests that need other limits construct
+    their own."""
+    return Supervisor()
+
+
+def _run_failures(
+    supervisor: Supervisor,
+    task: Task,
+    check_results: dict,
+    n: int,
+    start: int = 1,
+) -> Iteration:
+    """Feed n iterations with check_results through _check_loop and return
+    the last one."""
+    for number in range(start, start + n):
+        iteration = _FAILED_ITERATION.model_copy(
+            update={
+                "number": number,
+                "goal": f"Attempt {number}",
+                "check_results": check_results,
+            }
+        )
+        supervisor._check_loop(task, iteration)
+    return iteration
+
 
+def test_supervisor_continue_on_progress(supervisor):
     task = Task(
-        id=uuid4(),
+        id=_TASK_ID,
         description="Test task",
         goals=[],
         sources=["."],
         budget=Budget(max_iterations=50),
     )
 
-    iteration = Iteration(
+    iteration = _make_iteration(
         number=1,
         goal="Make changes",
-        changes=["file.py"],  # Has changes = progress
+        changes=_CHANGED_FILES,  # Has changes = progress
         check_results={},
-        decision=IterationDecision.CONTINUE,
-        decision_reason="",
-        timestamp=datetime.now(UTC),
     )
 
     result = supervisor.analyze(task, iteration)
     assert result.decision == SupervisionDecision.CONTINUE
 
 
-def test_supervisor_stop_on_budget_exhaustion():
-    supervisor = Supervisor()
-
+def test_supervisor_stop_on_budget_exhaustion(supervisor):
     task = Task(
-        id=uuid4(),
+        id=_TASK_ID,
         description="Test task",
         goals=[],
         sources=["."],
         budget=Budget(max_iterations=10, iteration_count=9),  # 90% used
     )
 
-    iteration = Iteration(
+    iteration = _make_iteration(
         number=9,
         goal="Another try",
         changes=[],
         check_results={},
-        decision=IterationDecision.CONTINUE,
-        decision_reason="",
-        timestamp=datetime.now(UTC),
     )
 
     result = supervisor.analyze(task, iteration)
@@ -93,231 +136,138 @@ def test_supervisor_stop_on_budget_exhaustion():
 
 
 class TestDecideRetryStrategy:
-    def test_first_failure_returns_continue_with_context(self):
+    def test_first_failure_returns_continue_with_context(self, supervisor):
         """First failure → CONTINUE_WITH_CONTEXT (give feedback to agent)."""
-        supervisor = Supervisor()
-        check_id = uuid4()
-        check_results = {check_id: CheckStatus.FAIL}
+        check_results = {_CHECK_ID_1: CheckStatus.FAIL}
         task = _make_task_with_conditions(check_results)
 
-        iteration = Iteration(
+        iteration = _make_iteration(
             number=1,
             goal="Make changes",
-            changes=["file.py"],
+            changes=_CHANGED_FILES,
             check_results=check_results,
-            decision=IterationDecision.CONTINUE,
             decision_reason="Check failed",
-            timestamp=datetime.now(UTC),
         )
 
         strategy, reason = supervisor.decide_retry_strategy(task, iteration)
         assert strategy == RetryStrategy.CONTINUE_WITH_CONTEXT
         assert "feedback" in reason.lower()
 
-    def test_same_error_twice_returns_rollback(self):
-        """Same error 2 times → ROLLBACK_AND_RETRY."""
-        supervisor = Supervisor()
-        check_id = uuid4()
-        check_results = {check_id: CheckStatus.FAIL}
-        task = _make_task_with_conditions(check_results)
-
-        # First iteration with failure
-        iteration1 = Iteration(
-            number=1,
-            goal="First attempt",
-            changes=["file.py"],
-            check_results=check_results,
-            decision=IterationDecision.CONTINUE,
-            decision_reason="Check failed",
-            timestamp=datetime.now(UTC),
-        )
-
-        # Register first error
-        supervisor._check_loop(task, iteration1)
-        supervisor.decide_retry_strategy(task, iteration1)
-
-        # Second iteration with same failure
-        iteration2 = Iteration(
-            number=2,
-            goal="Second attempt",
-            changes=["file.py"],
-            check_results=check_results,
-            decision=IterationDecision.CONTINUE,
-            decision_reason="Check still failed",
-            timestamp=datetime.now(UTC),
-        )
-
-        # Register second error (same pattern)
-        supervisor._check_loop(task, iteration2)
-
-        strategy, reason = supervisor.decide_retry_strategy(task, iteration2)
-        assert strategy == RetryStrategy.ROLLBACK_AND_RETRY
-        assert "repeated" in reason.lower() or "fresh" in reason.lower()
-
-    def test_same_error_exceeds_loop_limit_returns_stop(self):
-        """Same error >= loop_limit times → STOP."""
-        supervisor = Supervisor(loop_limit=3)
-        check_id = uuid4()
-        check_results = {check_id: CheckStatus.FAIL}
+    @pytest.mark.parametrize(
+        ("loop_limit", "rollback_limit", "rounds"),
+        [
+            pytest.param(
+                5,
+                2,
+                [
+                    (1, RetryStrategy.CONTINUE_WITH_CONTEXT, "feedback"),
+                    (1, RetryStrategy.ROLLBACK_AND_RETRY, "fresh"),
+                ],
+                id="same-error-twice-rolls-back",
+            ),
+            pytest.param(
+                3,
+                2,
+                [(6, RetryStrategy.STOP, "stopping")],
+                id="loop-limit-stops",
+            ),
+            pytest.param(
+                10,
+                1,
+                [
+                    (2, RetryStrategy.ROLLBACK_AND_RETRY, "fresh"),
+                    (2, RetryStrategy.CONTINUE_WITH_CONTEXT, "feedback"),
+                ],
+                id="rollback-limit-falls-back-to-context",
+            ),
+        ],
+    )
+    def test_repeated_error_strategy(self, loop_limit, rollback_limit, rounds):
+        """Repeated failures of the same check escalate from feedback to
+        rollback to STOP, within the configured limits.
+
+        Each round feeds n failing iterations through _check_loop, then
+        asks for a strategy.
+        """
+        supervisor = Supervisor(loop_limit=loop_limit, rollback_limit=rollback_limit)
+        check_results = {_CHECK_ID_1: CheckStatus.FAIL}
         task = _make_task_with_conditions(check_results)
 
-        # Simulate loop_limit failures with same error pattern
-        for i in range(5):
-            iteration = Iteration(
-                number=i + 1,
-                goal=f"Attempt {i + 1}",
-                changes=["file.py"],
-                check_results=check_results,
-                decision=IterationDecision.CONTINUE,
-                decision_reason="Check failed",
-                timestamp=datetime.now(UTC),
-            )
-            supervisor._check_loop(task, iteration)
-
-        # Final check
-        final_iteration = Iteration(
-            number=6,
-            goal="Final attempt",
-            changes=["file.py"],
-            check_results=check_results,
-            decision=IterationDecision.CONTINUE,
-            decision_reason="Check failed again",
-            timestamp=datetime.now(UTC),
-        )
-        supervisor._check_loop(task, final_iteration)
+        number = 1
+        for n, expected, reason_fragment in rounds:
+            iteration = _run_failures(supervisor, task, check_results, n, start=number)
+            number += n
 
-        strategy, reason = supervisor.decide_retry_strategy(task, final_iteration)
-        assert strategy == RetryStrategy.STOP
-        assert "stopping" in reason.lower()
+            strategy, reason = supervisor.decide_retry_strategy(task, iteration)
+            assert strategy == expected
+            assert reason_fragment in reason.lower()
 
-    def test_no_changes_in_iteration_returns_stop(self):
+    def test_no_changes_in_iteration_returns_stop(self, supervisor):
         """Iteration without changes → STOP (stagnation)."""
-        supervisor = Supervisor()
         task = _make_task_with_conditions({})
 
-        iteration = Iteration(
+        iteration = _make_iteration(
             number=1,
             goal="Make changes",
             changes=[],  # No changes
             check_results={},
-            decision=IterationDecision.CONTINUE,
             decision_reason="Nothing happened",
-            timestamp=datetime.now(UTC),
         )
 
         strategy, reason = supervisor.decide_retry_strategy(task, iteration)
         assert strategy == RetryStrategy.STOP
         assert "no changes" in reason.lower() or "stopping" in reason.lower()
 
-    def test_rollback_count_respects_limit(self):
-        """After rollback_limit rollbacks → STOP, not infinite rollback."""
-        supervisor = Supervisor(rollback_limit=1, loop_limit=10)
-        check_id = uuid4()
-        check_results = {check_id: CheckStatus.FAIL}
-        task = _make_task_with_conditions(check_results)
-
-        # Simulate 2 failures with same pattern, triggering first rollback
-        for i in range(2):
-            iteration = Iteration(
-                number=i + 1,
-                goal=f"Attempt {i + 1}",
-                changes=["file.py"],
-                check_results=check_results,
-                decision=IterationDecision.CONTINUE,
-                decision_reason="Check failed",
-                timestamp=datetime.now(UTC),
-            )
-            supervisor._check_loop(task, iteration)
-
-        # First rollback should happen
-        strategy1, _ = supervisor.decide_retry_strategy(task, iteration)
-        assert strategy1 == RetryStrategy.ROLLBACK_AND_RETRY
-
-        # Simulate 2 more failures after rollback
-        for i in range(2, 4):
-            iteration = Iteration(
-                number=i + 1,
-                goal=f"Attempt {i + 1}",
-                changes=["file.py"],
-                check_results=check_results,
-                decision=IterationDecision.CONTINUE,
-                decision_reason="Check failed",
-                timestamp=datetime.now(UTC),
-            )
-            supervisor._check_loop(task, iteration)
-
-        # Second time should NOT rollback (limit reached), should continue with context
-        strategy2, _ = supervisor.decide_retry_strategy(task, iteration)
-        # Since we've used 1 rollback and limit is 1, next should be CONTINUE_WITH_CONTEXT
-        assert strategy2 == RetryStrategy.CONTINUE_WITH_CONTEXT
-
-    def test_different_errors_dont_trigger_loop_detection(self):
+    def test_different_errors_dont_trigger_loop_detection(self, supervisor):
         """Different errors → not considered as loop."""
-        supervisor = Supervisor()
-        check_id1 = uuid4()
-        check_id2 = uuid4()
+
+        check1_fails = {_CHECK_ID_1: CheckStatus.FAIL}
+        check2_fails = {_CHECK_ID_2: CheckStatus.FAIL}
 
         # First iteration fails check1
-        task1 = _make_task_with_conditions({check_id1: CheckStatus.FAIL})
-        iteration1 = Iteration(
+        task1 = _make_task_with_conditions(check1_fails)
+        iteration1 = _make_iteration(
             number=1,
             goal="First attempt",
-            changes=["file.py"],
-            check_results={check_id1: CheckStatus.FAIL},
-            decision=IterationDecision.CONTINUE,
+            changes=_CHANGED_FILES,
+            check_results=check1_fails,
             decision_reason="Check 1 failed",
-            timestamp=datetime.now(UTC),
         )
         supervisor._check_loop(task1, iteration1)
 
         # Second iteration fails different check (check2)
-        task2 = _make_task_with_conditions({check_id2: CheckStatus.FAIL})
-        iteration2 = Iteration(
+        task2 = _make_task_with_conditions(check2_fails)
+        iteration2 = _make_iteration(
             number=2,
             goal="Second attempt",
-            changes=["file.py"],
-            check_results={check_id2: CheckStatus.FAIL},
-            decision=IterationDecision.CONTINUE,
+            changes=_CHANGED_FILES,
+            check_results=check2_fails,
             decision_reason="Check 2 failed",
-            timestamp=datetime.now(UTC),
         )
-        supervisor._check_loop(task2, iteration2)
-
-        strategy, reason = supervisor.decide_retry_strategy(task2, iteration2)
+        strategy, reason = supervisor.advance(task2, iteration2)
         # Different error, should just continue with context
         assert strategy == RetryStrategy.CONTINUE_WITH_CONTEXT
 
-    def test_error_hash_computed_from_failed_check_ids(self):
+    def test_error_hash_computed_from_failed_check_ids(self, supervisor):
         """Hash is computed from failed check IDs and task conditions."""
-        supervisor = Supervisor()
-        check_id1 = uuid4()
-        check_id2 = uuid4()
+        first_fails = {_CHECK_ID_1: CheckStatus.FAIL, _CHECK_ID_2: CheckStatus.PASS}
+        second_fails = {_CHECK_ID_1: CheckStatus.PASS, _CHECK_ID_2: CheckStatus.FAIL}
 
         # Same checks failing = same hash
-        task1 = _make_task_with_conditions(
-            {check_id1: CheckStatus.FAIL, check_id2: CheckStatus.PASS}
-        )
-        iteration1 = Iteration(
+        task1 = _make_task_with_conditions(first_fails)
+        iteration1 = _make_iteration(
             number=1,
             goal="Attempt 1",
-            changes=["file.py"],
-            check_results={check_id1: CheckStatus.FAIL, check_id2: CheckStatus.PASS},
-            decision=IterationDecision.CONTINUE,
-            decision_reason="",
-            timestamp=datetime.now(UTC),
+            changes=_CHANGED_FILES,
+            check_results=first_fails,
         )
 
-        task2 = _make_task_with_conditions(
-            {check_id1: CheckStatus.FAIL, check_id2: CheckStatus.PASS}
-        )
-        iteration2 = Iteration(
+        task2 = _make_task_with_conditions(first_fails)
+        iteration2 = _make_iteration(
             number=2,
             goal="Attempt 2",
-            changes=["file.py"],
-            check_results={check_id1: CheckStatus.FAIL, check_id2: CheckStatus.PASS},
-            decision=IterationDecision.CONTINUE,
-            decision_reason="",
-            timestamp=datetime.now(UTC),
+            changes=_CHANGED_FILES,
+            check_results=first_fails,
         )
 
         hash1 = supervisor._compute_error_hash(task1, iteration1)
@@ -325,17 +275,12 @@ class TestDecideRetryStrategy:
         assert hash1 == hash2
 
         # Different check failing = different hash
-        task3 = _make_task_with_conditions(
-            {check_id1: CheckStatus.PASS, check_id2: CheckStatus.FAIL}
-        )
-        iteration3 = Iteration(
+        task3 = _make_task_with_conditions(second_fails)
+        iteration3 = _make_iteration(
             number=3,
             goal="Attempt 3",
-            changes=["file.py"],
-            check_results={check_id1: CheckStatus.PASS, check_id2: CheckStatus.FAIL},
-            decision=IterationDecision.CONTINUE,
-            decision_reason="",
-            timestamp=datetime.now(UTC),
+            changes=_CHANGED_FILES,
+            check_results=second_fails,
         )
 
         hash3 = supervisor._compute_error_hash(task3, iteration3)
@@ -344,22 +289,11 @@ class TestDecideRetryStrategy:
     def test_reset_rollback_count(self):
         """reset_rollback_count() resets the counter."""
         supervisor = Supervisor(rollback_limit=1)
-        check_id = uuid4()
-        check_results = {check_id: CheckStatus.FAIL}
+        check_results = {_CHECK_ID_1: CheckStatus.FAIL}
         task = _make_task_with_conditions(check_results)
 
         # Trigger a rollback
-        for i in range(2):
-            iteration = Iteration(
-                number=i + 1,
-                goal=f"Attempt {i + 1}",
-                changes=["file.py"],
-                check_results=check_results,
-                decision=IterationDecision.CONTINUE,
-                decision_reason="",
-                timestamp=datetime.now(UTC),
-            )
-            supervisor._check_loop(task, iteration)
+        iteration = _run_failures(supervisor, task, check_results, 2)
 
         strategy, _ = supervisor.decide_retry_strategy(task, iteration)
         assert strategy == RetryStrategy.ROLLBACK_AND_RETRY
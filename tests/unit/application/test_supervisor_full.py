@@ -1,7 +1,7 @@
 """Comprehensive tests for Supervisor service."""
 
 from datetime import UTC, datetime
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -18,6 +18,12 @@ from src.domain.value_objects.supervision_enums import (
     SupervisionDecision,
 )
 
+CHECK_ID = UUID(int=0xC0FFEE)
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
+# Iteration validation copies check_results, so these are never mutated.
+_FAIL_RESULTS = {CHECK_ID: CheckStatus.FAIL}
+_PASS_RESULTS = {CHECK_ID: CheckStatus.PASS}
+
 
 @pytest.fixture
 def supervisor():
@@ -30,12 +36,12 @@ def supervisor():
 
 
 @pytest.fixture
-def task(tmp_path):
+def task():
     task = Task(
         id=uuid4(),
         description="Test task",
         goals=["Goal"],
-        sources=[str(tmp_path)],
+        sources=["."],
         budget=Budget(max_iterations=10, stagnation_limit=3),
     )
     task.plan = Plan(
@@ -60,20 +66,41 @@ def make_iteration(
         check_results=check_results or {},
         decision=IterationDecision.CONTINUE,
         decision_reason="Continue",
-        timestamp=datetime.now(UTC),
+        timestamp=_FIXED_TS,
+    )
+
+
+def _condition(check_id: UUID, status: CheckStatus) -> Condition:
+    return Condition(
+        id=check_id,
+        description=f"Test condition {check_id}",
+        role=ConditionRole.BLOCKING,
+        check_status=status,
+    )
+
+
+def _seed(task: Task, *specs: tuple[int, list[str] | None, dict | None]) -> None:
+    """Append iterations built from (number, changes, check_results) specs."""
+    task.iterations.extend(
+        make_iteration(number, changes=changes, check_results=check_results)
+        for number, changes, check_results in specs
     )
 
 
+def _stagnant_iterations(n: int) -> list[Iteration]:
+    """Iterations 1..n with no changes."""
+    return [make_iteration(number, changes=[]) for number in range(1, n + 1)]
+
+
+def _warm_loop(supervisor: Supervisor, task: Task, iteration: Iteration, n: int) -> None:
+    """Register iteration's error pattern n times via _check_loop."""
+    for _ in range(n):
+        supervisor._check_loop(task, iteration)
+
+
 def add_conditions_to_task(task: Task, check_results: dict) -> None:
     """Add conditions to task matching check_results."""
-    for check_id, status in check_results.items():
-        condition = Condition(
-            id=check_id,
-            description=f"Test condition {check_id}",
-            role=ConditionRole.BLOCKING,
-        )
-        condition.check_status = status
-        task.conditions.append(condition)
+    task.conditions.extend(_condition(*item) for item in check_results.items())
 
 
 class TestSupervisorAnalyze:
@@ -102,9 +129,7 @@ class TestSupervisorAnalyze:
 class TestSupervisorCheckStagnation:
     def test_detects_stagnation_after_limit(self, supervisor, task):
         """_check_stagnation should detect stagnation after limit."""
-        # Add stagnant iterations (no changes)
-        for i in range(3):
-            task.iterations.append(make_iteration(i + 1, changes=[]))
+        task.iterations.extend(_stagnant_iterations(3))
 
         result = supervisor._check_stagnation(task.iterations)
 
@@ -115,8 +140,7 @@ class TestSupervisorCheckStagnation:
     def test_suggests_deepen_context_at_2_stagnant(self, supervisor, task):
         """_check_stagnation should suggest DEEPEN_CONTEXT at 2 stagnant
         iterations."""
-        task.iterations.append(make_iteration(1, changes=[]))
-        task.iterations.append(make_iteration(2, changes=[]))
+        task.iterations.extend(_stagnant_iterations(2))
 
         result = supervisor._check_stagnation(task.iterations)
 
@@ -125,8 +149,7 @@ class TestSupervisorCheckStagnation:
 
     def test_no_stagnation_with_changes(self, supervisor, task):
         """_check_stagnation should not detect stagnation when changes made."""
-        task.iterations.append(make_iteration(1, changes=["file.py"]))
-        task.iterations.append(make_iteration(2, changes=["test.py"]))
+        _seed(task, (1, ["file.py"], None), (2, ["test.py"], None))
 
         result = supervisor._check_stagnation(task.iterations)
 
@@ -135,7 +158,7 @@ class TestSupervisorCheckStagnation:
     def test_no_stagnation_with_single_iteration(self, supervisor, task):
         """_check_stagnation should not detect stagnation with single
         iteration."""
-        task.iterations.append(make_iteration(1, changes=[]))
+        task.iterations.extend(_stagnant_iterations(1))
 
         result = supervisor._check_stagnation(task.iterations)
 
@@ -145,14 +168,12 @@ class TestSupervisorCheckStagnation:
 class TestSupervisorCheckLoop:
     def test_detects_loop_at_limit(self, supervisor, task):
         """_check_loop should detect loop when same error repeated at limit."""
-        check_id = uuid4()
-        check_results = {check_id: CheckStatus.FAIL}
+        check_results = _FAIL_RESULTS
         add_conditions_to_task(task, check_results)
         iteration = make_iteration(1, check_results=check_results)
 
         # Simulate running analyze multiple times with same error
-        for _ in range(5):
-            supervisor._check_loop(task, iteration)
+        _warm_loop(supervisor, task, iteration, 5)
 
         result = supervisor._check_loop(task, iteration)
 
@@ -162,14 +183,12 @@ class TestSupervisorCheckLoop:
 
     def test_suggests_replan_at_3_repeats(self, supervisor, task):
         """_check_loop should suggest REPLAN at 3 repeats."""
-        check_id = uuid4()
-        check_results = {check_id: CheckStatus.FAIL}
+        check_results = _FAIL_RESULTS
         add_conditions_to_task(task, check_results)
         iteration = make_iteration(1, check_results=check_results)
 
         # Simulate 3 occurrences
-        for _ in range(3):
-            supervisor._check_loop(task, iteration)
+        _warm_loop(supervisor, task, iteration, 3)
 
         result = supervisor._check_loop(task, iteration)
 
@@ -178,8 +197,7 @@ class TestSupervisorCheckLoop:
 
     def test_no_loop_with_passing_checks(self, supervisor, task):
         """_check_loop should not detect loop with passing checks."""
-        check_id = uuid4()
-        check_results = {check_id: CheckStatus.PASS}
+        check_results = _PASS_RESULTS
         add_conditions_to_task(task, check_results)
         iteration = make_iteration(1, check_results=check_results)
 
@@ -191,9 +209,11 @@ class TestSupervisorCheckLoop:
 class TestSupervisorCheckRegression:
     def test_detects_regression(self, supervisor, task):
         """_check_regression should detect regression from PASS to FAIL."""
-        check_id = uuid4()
-        task.iterations.append(make_iteration(1, check_results={check_id: CheckStatus.PASS}))
-        task.iterations.append(make_iteration(2, check_results={check_id: CheckStatus.FAIL}))
+        _seed(
+            task,
+            (1, None, _PASS_RESULTS),
+            (2, None, _FAIL_RESULTS),
+        )
 
         result = supervisor._check_regression(task.iterations)
 
@@ -204,9 +224,11 @@ class TestSupervisorCheckRegression:
     def test_no_regression_with_consistent_pass(self, supervisor, task):
         """_check_regression should not detect regression with consistent
         passes."""
-        check_id = uuid4()
-        task.iterations.append(make_iteration(1, check_results={check_id: CheckStatus.PASS}))
-        task.iterations.append(make_iteration(2, check_results={check_id: CheckStatus.PASS}))
+        _seed(
+            task,
+            (1, None, _PASS_RESULTS),
+            (2, None, _PASS_RESULTS),
+        )
 
         result = supervisor._check_regression(task.iterations)
 
@@ -215,8 +237,7 @@ class TestSupervisorCheckRegression:
     def test_no_regression_with_single_iteration(self, supervisor, task):
         """_check_regression should not detect regression with single
         iteration."""
-        check_id = uuid4()
-        task.iterations.append(make_iteration(1, check_results={check_id: CheckStatus.FAIL}))
+        task.iterations.append(make_iteration(1, check_results=_FAIL_RESULTS))
 
         result = supervisor._check_regression(task.iterations)
 
@@ -226,10 +247,12 @@ class TestSupervisorCheckRegression:
 class TestSupervisorCheckFlaky:
     def test_detects_flaky_pass_fail_pass(self, supervisor, task):
         """_check_flaky should detect PASS-FAIL-PASS pattern."""
-        check_id = uuid4()
-        task.iterations.append(make_iteration(1, check_results={check_id: CheckStatus.PASS}))
-        task.iterations.append(make_iteration(2, check_results={check_id: CheckStatus.FAIL}))
-        task.iterations.append(make_iteration(3, check_results={check_id: CheckStatus.PASS}))
+        _seed(
+            task,
+            (1, None, _PASS_RESULTS),
+            (2, None, _FAIL_RESULTS),
+            (3, None, _PASS_RESULTS),
+        )
 
         result = supervisor._check_flaky(task.iterations)
 
@@ -239,10 +262,12 @@ class TestSupervisorCheckFlaky:
 
     def test_detects_flaky_fail_pass_fail(self, supervisor, task):
         """_check_flaky should detect FAIL-PASS-FAIL pattern."""
-        check_id = uuid4()
-        task.iterations.append(make_iteration(1, check_results={check_id: CheckStatus.FAIL}))
-        task.iterations.append(make_iteration(2, check_results={check_id: CheckStatus.PASS}))
-        task.iterations.append(make_iteration(3, check_results={check_id: CheckStatus.FAIL}))
+        _seed(
+            task,
+            (1, None, _FAIL_RESULTS),
+            (2, None, _PASS_RESULTS),
+            (3, None, _FAIL_RESULTS),
+        )
 
         result = supervisor._check_flaky(task.iterations)
 
@@ -252,10 +277,12 @@ class TestSupervisorCheckFlaky:
 
     def test_no_flaky_with_consistent_results(self, supervisor, task):
         """_check_flaky should not detect flaky with consistent results."""
-        check_id = uuid4()
-        task.iterations.append(make_iteration(1, check_results={check_id: CheckStatus.FAIL}))
-        task.iterations.append(make_iteration(2, check_results={check_id: CheckStatus.FAIL}))
-        task.iterations.append(make_iteration(3, check_results={check_id: CheckStatus.FAIL}))
+        _seed(
+            task,
+            (1, None, _FAIL_RESULTS),
+            (2, None, _FAIL_RESULTS),
+            (3, None, _FAIL_RESULTS),
+        )
 
         result = supervisor._check_flaky(task.iterations)
 
@@ -263,9 +290,11 @@ class TestSupervisorCheckFlaky:
 
     def test_no_flaky_with_less_than_3_iterations(self, supervisor, task):
         """_check_flaky should not detect flaky with < 3 iterations."""
-        check_id = uuid4()
-        task.iterations.append(make_iteration(1, check_results={check_id: CheckStatus.PASS}))
-        task.iterations.append(make_iteration(2, check_results={check_id: CheckStatus.FAIL}))
+        _seed(
+            task,
+            (1, None, _PASS_RESULTS),
+            (2, None, _FAIL_RESULTS),
+        )
 
         result = supervisor._check_flaky(task.iterations)
 
@@ -275,14 +304,12 @@ class TestSupervisorCheckFlaky:
 class TestSupervisorDecideRetryStrategy:
     def test_stop_on_same_error_at_limit(self, supervisor, task):
         """decide_retry_strategy should STOP at loop limit."""
-        check_id = uuid4()
-        check_results = {check_id: CheckStatus.FAIL}
+        check_results = _FAIL_RESULTS
         add_conditions_to_task(task, check_results)
         iteration = make_iteration(1, check_results=check_results)
 
         # Fill error history to limit
-        for _ in range(5):
-            supervisor._check_loop(task, iteration)
+        _warm_loop(supervisor, task, iteration, 5)
 
         strategy, reason = supervisor.decide_retry_strategy(task, iteration)
 
@@ -292,14 +319,12 @@ class TestSupervisorDecideRetryStrategy:
     def test_rollback_on_repeated_error(self, supervisor, task):
         """decide_retry_strategy should ROLLBACK_AND_RETRY on repeated
         error."""
-        check_id = uuid4()
-        check_results = {check_id: CheckStatus.FAIL}
+        check_results = _FAIL_RESULTS
         add_conditions_to_task(task, check_results)
         iteration = make_iteration(1, check_results=check_results)
 
         # Add to error history
-        for _ in range(2):
-            supervisor._check_loop(task, iteration)
+        _warm_loop(supervisor, task, iteration, 2)
 
         strategy, reason = supervisor.decide_retry_strategy(task, iteration)
 
@@ -317,8 +342,7 @@ class TestSupervisorDecideRetryStrategy:
 
     def test_continue_with_context_otherwise(self, supervisor, task):
         """decide_retry_strategy should CONTINUE_WITH_CONTEXT by default."""
-        check_id = uuid4()
-        check_results = {check_id: CheckStatus.FAIL}
+        check_results = _FAIL_RESULTS
         add_conditions_to_task(task, check_results)
         iteration = make_iteration(1, changes=["file.py"], check_results=check_results)
 
@@ -328,11 +352,26 @@ class TestSupervisorDecideRetryStrategy:
         assert "feedback" in reason.lower()
 
 
+class TestSupervisorAdvance:
+    def test_registers_error_before_deciding(self, supervisor, task):
+        """advance should count the iteration's error before deciding, so the
+        second identical failure already triggers a rollback."""
+        check_results = _FAIL_RESULTS
+        add_conditions_to_task(task, check_results)
+        iteration = make_iteration(1, changes=["file.py"], check_results=check_results)
+
+        first, _ = supervisor.advance(task, iteration)
+        second, _ = supervisor.advance(task, iteration)
+
+        assert first == RetryStrategy.CONTINUE_WITH_CONTEXT
+        assert second == RetryStrategy.ROLLBACK_AND_RETRY
+        assert len(supervisor._error_history) == 1
+
+
 class TestSupervisorReset:
     def test_reset_error_history(self, supervisor, task):
         """reset_error_history should clear error history."""
-        check_id = uuid4()
-        check_results = {check_id: CheckStatus.FAIL}
+        check_results = _FAIL_RESULTS
         add_conditions_to_task(task, check_results)
         iteration = make_iteration(1, check_results=check_results)
 
@@ -356,8 +395,7 @@ class TestSupervisorReset:
 class TestSupervisorComputeErrorHash:
     def test_computes_hash_for_failed_checks(self, supervisor, task):
         """_compute_error_hash should compute hash for failed checks."""
-        check_id = uuid4()
-        check_results = {check_id: CheckStatus.FAIL}
+        check_results = _FAIL_RESULTS
         add_conditions_to_task(task, check_results)
         iteration = make_iteration(1, check_results=check_results)
 
@@ -368,8 +406,7 @@ class TestSupervisorComputeErrorHash:
 
     def test_returns_none_for_all_passing(self, supervisor, task):
         """_compute_error_hash should return None when all checks pass."""
-        check_id = uuid4()
-        check_results = {check_id: CheckStatus.PASS}
+        check_results = _PASS_RESULTS
         add_conditions_to_task(task, check_results)
         iteration = make_iteration(1, check_results=check_results)
 
@@ -379,8 +416,7 @@ class TestSupervisorComputeErrorHash:
 
     def test_same_hash_for_same_failures(self, supervisor, task):
         """_compute_error_hash should return same hash for same failures."""
-        check_id = uuid4()
-        check_results = {check_id: CheckStatus.FAIL}
+        check_results = _FAIL_RESULTS
         add_conditions_to_task(task, check_results)
         iteration1 = make_iteration(1, check_results=check_results)
         iteration2 = make_iteration(2, check_results=check_results)
@@ -391,91 +427,36 @@ class TestSupervisorComputeErrorHash:
         assert hash1 == hash2
 
 
-class TestSupervisorCountStagnantIterations:
-    def test_counts_trailing_stagnant_iterations(self, supervisor, task):
-        """_count_stagnant_iterations should count trailing stagnant
-        iterations."""
-        task.iterations.append(make_iteration(1, changes=["file.py"]))
-        task.iterations.append(make_iteration(2, changes=[]))
-        task.iterations.append(make_iteration(3, changes=[]))
-
-        count = supervisor._count_stagnant_iterations(task.iterations)
-
-        assert count == 2
+# Changes per iteration, oldest first, and the expected trailing stagnant count.
+_STAGNANT_CASES = [
+    pytest.param([["file.py"], [], []], 2, id="trailing"),
+    pytest.param([[], ["file.py"], []], 1, id="stops-at-non-stagnant"),
+    pytest.param([], 0, id="empty"),
+]
 
-    def test_stops_at_first_non_stagnant(self, supervisor, task):
-        """_count_stagnant_iterations should stop at first non-stagnant."""
-        task.iterations.append(make_iteration(1, changes=[]))
-        task.iterations.append(make_iteration(2, changes=["file.py"]))
-        task.iterations.append(make_iteration(3, changes=[]))
+_FLAKY_CASES = [
+    pytest.param([CheckStatus.PASS, CheckStatus.FAIL, CheckStatus.PASS], True, id="pass-fail-pass"),
+    pytest.param([CheckStatus.FAIL, CheckStatus.PASS, CheckStatus.FAIL], True, id="fail-pass-fail"),
+    pytest.param([CheckStatus.FAIL, CheckStatus.FAIL, CheckStatus.FAIL], False, id="consistent"),
+    pytest.param([CheckStatus.PASS, CheckStatus.FAIL], False, id="less-than-3"),
+    # None values are filtered out, leaving too few statuses
+    pytest.param([None, CheckStatus.PASS, CheckStatus.FAIL], False, id="none-values"),
+]
 
-        count = supervisor._count_stagnant_iterations(task.iterations)
 
-        assert count == 1
-
-    def test_returns_zero_for_empty_iterations(self, supervisor, task):
-        """_count_stagnant_iterations should return 0 for empty iterations."""
-        count = supervisor._count_stagnant_iterations([])
+class TestSupervisorCountStagnantIterations:
+    @pytest.mark.parametrize(("changes", "expected"), _STAGNANT_CASES)
+    def test_count_stagnant_iterations(self, supervisor, changes, expected):
+        """_count_stagnant_iterations should count trailing iterations
+        without changes."""
+        iterations = [make_iteration(n, changes=c) for n, c in enumerate(changes, start=1)]
 
-        assert count == 0
+        assert supervisor._count_stagnant_iterations(iterations) == expected
 
 
 class TestSupervisorIsFlakyPattern:
-    def test_detects_pass_fail_pass(self, supervisor):
-        """_is_flaky_pattern should detect PASS-FAIL-PASS."""
-        result = supervisor._is_flaky_pattern(
-            [
-                CheckStatus.PASS,
-                CheckStatus.FAIL,
-                CheckStatus.PASS,
-            ]
-        )
-
-        assert result is True
-
-    def test_detects_fail_pass_fail(self, supervisor):
-        """_is_flaky_pattern should detect FAIL-PASS-FAIL."""
-        result = supervisor._is_flaky_pattern(
-            [
-                CheckStatus.FAIL,
-                CheckStatus.PASS,
-                CheckStatus.FAIL,
-            ]
-        )
-
-        assert result is True
-
-    def test_not_flaky_for_consistent(self, supervisor):
-        """_is_flaky_pattern should return False for consistent results."""
-        result = supervisor._is_flaky_pattern(
-            [
-                CheckStatus.FAIL,
-                CheckStatus.FAIL,
-                CheckStatus.FAIL,
-            ]
-        )
-
-        assert result is False
-
-    def test_not_flaky_for_less_than_3(self, supervisor):
-        """_is_flaky_pattern should return False for < 3 statuses."""
-        result = supervisor._is_flaky_pattern(
-            [
-                CheckStatus.PASS,
-                CheckStatus.FAIL,
-            ]
-        )
-
-        assert result is False
-
-    def test_handles_none_values(self, supervisor):
-        """_is_flaky_pattern should filter out None values."""
-        result = supervisor._is_flaky_pattern(
-            [
-                None,
-                CheckStatus.PASS,
-                CheckStatus.FAIL,
-            ]
-        )
-
-        assert result is False  # Not enough non-None values
+    @pytest.mark.parametrize(("statuses", "expected"), _FLAKY_CASES)
+    def test_is_flaky_pattern(self, supervisor, statuses, expected):
+        """_is_flaky_pattern should detect alternating PASS/FAIL over three
+        non-None statuses."""
+        assert supervisor._is_flaky_pattern(statuses) is expected
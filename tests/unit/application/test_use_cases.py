@@ -1,7 +1,9 @@
 """Unit tests for application use cases."""
 
-from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+from collections.abc import Coroutine
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID
 
 import pytest
 
@@ -13,156 +15,167 @@ from src.domain.entities.task import Task
 from src.domain.value_objects.condition_enums import ApprovalStatus, ConditionRole
 from src.domain.value_objects.task_status import TaskStatus
 
+# The use cases only await the repo stubs, so one event loop serves the module.
+_module_loop = pytest.mark.asyncio(loop_scope="module")
+
+_TASK_ID = UUID(int=0x1)
+_BLOCKING_ID = UUID(int=0x2)
+_SIGNAL_ID = UUID(int=0x3)
+_CHECK_ID = UUID(int=0x4)
+
+# Validated once. Fixtures hand out copies, replacing the parts the use
+# cases mutate (status, conditions, plan) with fresh objects.
+_TASK_TEMPLATE = Task(
+    id=_TASK_ID,
+    description="Test task",
+    goals=["Goal"],
+    sources=["."],
+)
+_CONDITION_TEMPLATES = (
+    # Blocking condition with check_id
+    Condition(
+        id=_BLOCKING_ID,
+        description="Tests pass",
+        role=ConditionRole.BLOCKING,
+        check_id=_CHECK_ID,
+    ),
+    # Signal condition without check_id
+    Condition(
+        id=_SIGNAL_ID,
+        description="Coverage",
+        role=ConditionRole.SIGNAL,
+    ),
+)
+# Blocking without check_id - will be verified by agent during delivery
+_MANUAL_CONDITION_TEMPLATE = Condition(
+    id=_BLOCKING_ID,
+    description="Manual check",
+    role=ConditionRole.BLOCKING,
+    check_id=None,
+)
+_PLAN_TEMPLATE = Plan(
+    goal="Implement feature",
+    boundaries=["No breaking changes"],
+    steps=[
+        PlanStep(number=1, description="Step 1"),
+    ],
+)
+
+
+class _AsyncCounter:
+    """Async callable that only counts its calls."""
+
+    def __init__(self) -> None:
+        self.call_count = 0
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> None:
+        self.call_count += 1
+
+
+def _run_to_completion[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Drive a coroutine that never suspends without an event loop."""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        result: T = stop.value
+        return result
+    coro.close()
+    raise AssertionError("coroutine suspended")
+
+
+@pytest.fixture
+def mock_task_repo() -> SimpleNamespace:
+    return SimpleNamespace(
+        save=_AsyncCounter(),
+        save_conditions_approval=_AsyncCounter(),
+        save_plan_approval=_AsyncCounter(),
+    )
 
-class TestApproveConditions:
-    @pytest.fixture
-    def mock_task_repo(self) -> MagicMock:
-        repo = MagicMock()
-        repo.save = AsyncMock()
-        repo.save_conditions_approval = AsyncMock()
-        return repo
 
+class TestApproveConditions:
     @pytest.fixture
-    def task_with_conditions(self) -> Task:
-        task = Task(
-            id=uuid4(),
-            description="Test task",
-            goals=["Goal"],
-            sources=["."],
-        )
-        # Add blocking condition with check_id
-        blocking = Condition(
-            id=uuid4(),
-            description="Tests pass",
-            role=ConditionRole.BLOCKING,
-            check_id=uuid4(),
-        )
-        # Add signal condition without check_id
-        signal = Condition(
-            id=uuid4(),
-            description="Coverage",
-            role=ConditionRole.SIGNAL,
-        )
-        task.conditions = [blocking, signal]
-        return task
-
-    async def test_auto_approve_approves_all_conditions(
-        self, mock_task_repo: MagicMock, task_with_conditions: Task
+    def use_case(self, mock_task_repo: SimpleNamespace) -> ApproveConditions:
+        return ApproveConditions(mock_task_repo)
+
+    @_module_loop
+    @pytest.mark.parametrize(
+        ("conditions", "auto_approve", "expected_status"),
+        [
+            (_CONDITION_TEMPLATES, True, TaskStatus.APPROVAL_CONDITIONS),
+            # Manual blocking conditions can be approved too
+            ((_MANUAL_CONDITION_TEMPLATE,), True, TaskStatus.APPROVAL_CONDITIONS),
+            # Without auto_approve the status should not change
+            (_CONDITION_TEMPLATES, False, TaskStatus.INTAKE),
+        ],
+        ids=["auto-approve", "manual-blocking", "no-auto-approve"],
+    )
+    async def test_approve_conditions(
+        self,
+        use_case: ApproveConditions,
+        mock_task_repo: SimpleNamespace,
+        conditions: tuple[Condition, ...],
+        auto_approve: bool,
+        expected_status: TaskStatus,
     ) -> None:
-        use_case = ApproveConditions(mock_task_repo)
-
-        result = await use_case.execute(task_with_conditions, auto_approve=True)
-
-        assert result is True
-        assert task_with_conditions.status == TaskStatus.APPROVAL_CONDITIONS
-        for cond in task_with_conditions.conditions:
-            assert cond.approval_status == ApprovalStatus.APPROVED
-        mock_task_repo.save_conditions_approval.assert_called_once()
-        mock_task_repo.save.assert_called_once()
-
-    async def test_no_auto_approve_returns_false(
-        self, mock_task_repo: MagicMock, task_with_conditions: Task
-    ) -> None:
-        use_case = ApproveConditions(mock_task_repo)
-
-        result = await use_case.execute(task_with_conditions, auto_approve=False)
-
-        assert result is False
-        # Status should not change
-        assert task_with_conditions.status == TaskStatus.INTAKE
-        mock_task_repo.save.assert_not_called()
-
-    async def test_blocking_condition_without_check_id_can_be_approved(
-        self, mock_task_repo: MagicMock
-    ) -> None:
-        """Manual blocking conditions can be approved - verified by agent during delivery."""
-        task = Task(
-            id=uuid4(),
-            description="Test",
-            goals=[],
-            sources=["."],
+        task = _TASK_TEMPLATE.model_copy(
+            update={"conditions": [c.model_copy() for c in conditions]}
         )
-        # Blocking without check_id - will be verified by agent later
-        task.conditions = [
-            Condition(
-                id=uuid4(),
-                description="Manual check",
-                role=ConditionRole.BLOCKING,
-                check_id=None,
-            )
-        ]
 
-        use_case = ApproveConditions(mock_task_repo)
-        result = await use_case.execute(task, auto_approve=True)
+        result = await use_case.execute(task, auto_approve=auto_approve)
 
-        # Should return True (process continues)
-        assert result is True
-        # Condition should be approved (will be verified by agent later)
-        assert task.conditions[0].approval_status == ApprovalStatus.APPROVED
+        assert result is auto_approve
+        assert task.status == expected_status
+        if auto_approve:
+            assert all(cond.approval_status is ApprovalStatus.APPROVED for cond in task.conditions)
+        else:
+            assert not any(
+                cond.approval_status is ApprovalStatus.APPROVED for cond in task.conditions
+            )
+        assert mock_task_repo.save_conditions_approval.call_count == int(auto_approve)
+        assert mock_task_repo.save.call_count == int(auto_approve)
 
 
 class TestApprovePlan:
     @pytest.fixture
-    def mock_task_repo(self) -> MagicMock:
-        repo = MagicMock()
-        repo.save = AsyncMock()
-        repo.save_plan_approval = AsyncMock()
-        return repo
+    def use_case(self, mock_task_repo: SimpleNamespace) -> ApprovePlan:
+        return ApprovePlan(mock_task_repo)
 
     @pytest.fixture
     def task_with_plan(self) -> Task:
-        task = Task(
-            id=uuid4(),
-            description="Test task",
-            goals=["Goal"],
-            sources=["."],
-        )
-        task.plan = Plan(
-            goal="Implement feature",
-            boundaries=["No breaking changes"],
-            steps=[
-                PlanStep(number=1, description="Step 1"),
-            ],
-        )
-        return task
-
-    async def test_auto_approve_approves_plan(
-        self, mock_task_repo: MagicMock, task_with_plan: Task
+        return _TASK_TEMPLATE.model_copy(update={"plan": _PLAN_TEMPLATE.model_copy()})
+
+    @_module_loop
+    @pytest.mark.parametrize(
+        ("auto_approve", "expected_status"),
+        [
+            (True, TaskStatus.APPROVAL_PLAN),
+            (False, TaskStatus.INTAKE),
+        ],
+        ids=["auto-approve", "no-auto-approve"],
+    )
+    async def test_approve_plan(
+        self,
+        use_case: ApprovePlan,
+        mock_task_repo: SimpleNamespace,
+        task_with_plan: Task,
+        auto_approve: bool,
+        expected_status: TaskStatus,
     ) -> None:
-        use_case = ApprovePlan(mock_task_repo)
+        result = await use_case.execute(task_with_plan, auto_approve=auto_approve)
 
-        result = await use_case.execute(task_with_plan, auto_approve=True)
-
-        assert result is True
+        assert result is auto_approve
         assert task_with_plan.plan is not None
-        assert task_with_plan.plan.approved is True
-        assert task_with_plan.status == TaskStatus.APPROVAL_PLAN
-        mock_task_repo.save_plan_approval.assert_called_once()
-        mock_task_repo.save.assert_called_once()
+        assert task_with_plan.plan.approved is auto_approve
+        assert task_with_plan.status == expected_status
+        assert mock_task_repo.save_plan_approval.call_count == int(auto_approve)
+        assert mock_task_repo.save.call_count == int(auto_approve)
 
-    async def test_no_auto_approve_returns_false(
-        self, mock_task_repo: MagicMock, task_with_plan: Task
+    def test_no_plan_returns_false(
+        self, use_case: ApprovePlan, mock_task_repo: SimpleNamespace
     ) -> None:
-        use_case = ApprovePlan(mock_task_repo)
-
-        result = await use_case.execute(task_with_plan, auto_approve=False)
-
-        assert result is False
-        assert task_with_plan.plan is not None
-        assert task_with_plan.plan.approved is False
-        mock_task_repo.save.assert_not_called()
-
-    async def test_no_plan_returns_false(self, mock_task_repo: MagicMock) -> None:
-        task = Task(
-            id=uuid4(),
-            description="Test",
-            goals=[],
-            sources=["."],
-            plan=None,
-        )
+        task = _TASK_TEMPLATE.model_copy(update={"plan": None})
 
-        use_case = ApprovePlan(mock_task_repo)
-        result = await use_case.execute(task, auto_approve=True)
+        result = _run_to_completion(use_case.execute(task, auto_approve=True))
 
         assert result is False
-        mock_task_repo.save.assert_not_called()
+        assert mock_task_repo.save.call_count == 0
@@ -1,9 +1,11 @@
 """Comprehensive unit tests for application use cases."""
 
+import functools
 import json
 from datetime import UTC, datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+from uuid import UUID
 
 import pytest
 
@@ -18,25 +20,20 @@ from src.domain.entities.condition import Condition
 from src.domain.entities.plan import Plan, PlanStep
 from src.domain.entities.task import Task
 from src.domain.entities.verification_inventory import VerificationInventory
-from src.domain.ports.agent_port import AgentResult
-from src.domain.ports.diff_port import DiffResult
+from src.domain.ports.agent_port import AgentPort, AgentResult
+from src.domain.ports.check_runner_port import CheckRunnerPort
+from src.domain.ports.diff_port import DiffPort, DiffResult
+from src.domain.ports.task_repo_port import TaskRepoPort
+from src.domain.ports.verification_port import VerificationPort
 from src.domain.value_objects.check_types import CheckKind, CheckSpec
 from src.domain.value_objects.clarification import ClarificationAnswer
 from src.domain.value_objects.condition_enums import CheckStatus, ConditionRole
 from src.domain.value_objects.evidence_types import EvidenceRef
 from src.domain.value_objects.task_status import TaskStatus
 
-# ===== CreatePlan Tests =====
-
-
-class TestCreatePlanAskClarifications:
-    @pytest.fixture
-    def mock_agent(self):
-        agent = AsyncMock()
-        # Wrap JSON in markdown code block for extract_json to parse correctly
-        agent.execute.return_value = AgentResult(
-            messages=[],
-            final_response="""```json
+# Agent responses, serialized once at import.
+# Wrap JSON in markdown code block for extract_json to parse correctly
+_CLARIFICATION_RESPONSE_MD = """```json
 [
     {
         "id": "q1",
@@ -48,22 +45,78 @@ class TestCreatePlanAskClarifications:
         ]
     }
 ]
-```""",
-            tools_used=["Read"],
-        )
-        return agent
+```"""
+_PLAN_RESPONSE_JSON = json.dumps(
+    {
+        "goal": "Implement feature",
+        "boundaries": ["No breaking changes"],
+        "steps": [
+            {"number": 1, "description": "Step 1", "target_files": ["file.py"]},
+            {"number": 2, "description": "Step 2", "target_files": ["test.py"]},
+        ],
+        "risks": ["May break tests"],
+        "assumptions": ["FastAPI is installed"],
+        "replan_conditions": ["If tests fail"],
+    }
+)
+_REFINED_PLAN_RESPONSE_JSON = json.dumps(
+    {
+        "goal": "Refined goal",
+        "boundaries": [],
+        "steps": [{"number": 1, "description": "Refined step"}],
+        "risks": [],
+        "assumptions": [],
+        "replan_conditions": [],
+    }
+)
+
+# The use cases only read these results, so every test can share them.
+_CLARIFICATION_RESULT = AgentResult(
+    messages=[], final_response=_CLARIFICATION_RESPONSE_MD, tools_used=["Read"]
+)
+_PLAN_RESULT = AgentResult(
+    messages=[], final_response=_PLAN_RESPONSE_JSON, tools_used=["Read", "Grep"]
+)
+_REFINED_PLAN_RESULT = AgentResult(
+    messages=[], final_response=_REFINED_PLAN_RESPONSE_JSON, tools_used=["Read"]
+)
+
+_TASK_ID = UUID(int=0x1)
+_CONDITION_ID = UUID(int=0x2)
+_CHECK_ID = UUID(int=0x3)
+_LINT_CHECK_ID = UUID(int=0x4)
+_BUILD_CHECK_ID = UUID(int=0x5)
 
+
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """Source directory for every task in the module; the use cases never
+    touch it, they only need a path."""
+    return tmp_path_factory.mktemp("use_cases")
+
+
+@pytest.fixture
+def mock_task_repo():
+    return AsyncMock(spec=TaskRepoPort)
+
+
+# ===== CreatePlan Tests =====
+
+
+class TestCreatePlanAskClarifications:
     @pytest.fixture
-    def mock_task_repo(self):
-        return AsyncMock()
+    def mock_agent(self):
+        agent = AsyncMock(spec=AgentPort)
+        agent.execute.return_value = _CLARIFICATION_RESULT
+        return agent
 
     @pytest.fixture
-    def task(self, tmp_path):
+    def task(self, shared_tmp):
         task = Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Build a new feature",
             goals=["Goal 1"],
-            sources=[str(tmp_path)],
+            sources=[str(shared_tmp)],
         )
         task.verification_inventory = VerificationInventory(
             checks=[],
@@ -100,13 +153,15 @@ class TestCreatePlanAskClarifications:
         assert questions == []
 
     @pytest.mark.asyncio
-    async def test_ask_clarifications_without_inventory(self, mock_agent, mock_task_repo, tmp_path):
+    async def test_ask_clarifications_without_inventory(
+        self, mock_agent, mock_task_repo, shared_tmp
+    ):
         """ask_clarifications should work without verification inventory."""
         task = Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Build feature",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[str(shared_tmp)],
         )
         mock_agent.execute.return_value = AgentResult(
             messages=[],
@@ -139,37 +194,17 @@ class TestCreatePlanAskClarifications:
 class TestCreatePlanExecute:
     @pytest.fixture
     def mock_agent(self):
-        agent = AsyncMock()
-        agent.execute.return_value = AgentResult(
-            messages=[],
-            final_response=json.dumps(
-                {
-                    "goal": "Implement feature",
-                    "boundaries": ["No breaking changes"],
-                    "steps": [
-                        {"number": 1, "description": "Step 1", "target_files": ["file.py"]},
-                        {"number": 2, "description": "Step 2", "target_files": ["test.py"]},
-                    ],
-                    "risks": ["May break tests"],
-                    "assumptions": ["FastAPI is installed"],
-                    "replan_conditions": ["If tests fail"],
-                }
-            ),
-            tools_used=["Read", "Grep"],
-        )
+        agent = AsyncMock(spec=AgentPort)
+        agent.execute.return_value = _PLAN_RESULT
         return agent
 
     @pytest.fixture
-    def mock_task_repo(self):
-        return AsyncMock()
-
-    @pytest.fixture
-    def task(self, tmp_path):
+    def task(self, shared_tmp):
         return Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Build feature",
             goals=["Goal 1"],
-            sources=[str(tmp_path)],
+            sources=[str(shared_tmp)],
         )
 
     @pytest.mark.asyncio
@@ -233,34 +268,17 @@ class TestCreatePlanExecute:
 class TestCreatePlanRefine:
     @pytest.fixture
     def mock_agent(self):
-        agent = AsyncMock()
-        agent.execute.return_value = AgentResult(
-            messages=[],
-            final_response=json.dumps(
-                {
-                    "goal": "Refined goal",
-                    "boundaries": [],
-                    "steps": [{"number": 1, "description": "Refined step"}],
-                    "risks": [],
-                    "assumptions": [],
-                    "replan_conditions": [],
-                }
-            ),
-            tools_used=["Read"],
-        )
+        agent = AsyncMock(spec=AgentPort)
+        agent.execute.return_value = _REFINED_PLAN_RESULT
         return agent
 
     @pytest.fixture
-    def mock_task_repo(self):
-        return AsyncMock()
-
-    @pytest.fixture
-    def task_with_plan(self, tmp_path):
+    def task_with_plan(self, shared_tmp):
         task = Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Build feature",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[str(shared_tmp)],
         )
         task.plan = Plan(
             goal="Original goal",
@@ -281,13 +299,13 @@ class TestCreatePlanRefine:
         mock_task_repo.save.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_refine_without_existing_plan(self, mock_agent, mock_task_repo, tmp_path):
+    async def test_refine_without_existing_plan(self, mock_agent, mock_task_repo, shared_tmp):
         """Refine should create new plan if none exists."""
         task = Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Build feature",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[str(shared_tmp)],
         )
         use_case = CreatePlan(mock_agent, mock_task_repo)
 
@@ -315,10 +333,65 @@ class TestCreatePlanRefine:
 # ===== FinalizeTask Tests =====
 
 
+def _make_condition(
+    task_id: UUID,
+    *,
+    description: str = "Test passes",
+    status: CheckStatus | None = None,
+    approve: bool = False,
+    evidence: bool = False,
+) -> Condition:
+    """Blocking condition, optionally checked, approved and backed by evidence."""
+    cond = Condition(
+        id=_CONDITION_ID,
+        description=description,
+        role=ConditionRole.BLOCKING,
+    )
+    if status is not None:
+        cond.check_status = status
+    if approve:
+        cond.approve()
+    if evidence:
+        cond.evidence_ref = EvidenceRef(
+            task_id=task_id,
+            condition_id=cond.id,
+            check_id=None,
+            artifact_path_rel="artifact.json",
+            log_path_rel="log.txt",
+        )
+    return cond
+
+
+def _blocked_task(source: str) -> Task:
+    """Blocked task whose blocking condition still awaits approval."""
+    task = Task(
+        id=_TASK_ID,
+        description="Test task",
+        goals=["Goal"],
+        sources=[source],
+    )
+    task.status = TaskStatus.BLOCKED
+    task.conditions = [_make_condition(task.id, description="Manual approval")]
+    return task
+
+
+def _failing_task(source: str, **budget: int) -> Task:
+    """Task with a failing blocking condition and the given budget."""
+    task = Task(
+        id=_TASK_ID,
+        description="Test task",
+        goals=["Goal"],
+        sources=[source],
+        budget=Budget(**budget),
+    )
+    task.conditions = [_make_condition(task.id, status=CheckStatus.FAIL)]
+    return task
+
+
 class TestFinalizeTask:
     @pytest.fixture
     def mock_diff_port(self):
-        port = AsyncMock()
+        port = AsyncMock(spec=DiffPort)
         port.get_worktree_diff.return_value = DiffResult(
             diff="+ new line",
             patch="patch content",
@@ -328,76 +401,22 @@ class TestFinalizeTask:
         )
         return port
 
-    @pytest.fixture
-    def mock_task_repo(self):
-        return AsyncMock()
-
     @pytest.fixture
     def finalize_use_case(self, mock_diff_port, mock_task_repo):
         return FinalizeTask(mock_diff_port, mock_task_repo)
 
     @pytest.fixture
-    def task_can_mark_done(self, tmp_path):
+    def task_can_mark_done(self, shared_tmp):
         """Task with all conditions passing."""
         task = Task(
-            id=uuid4(),
-            description="Test task",
-            goals=["Goal"],
-            sources=[str(tmp_path)],
-        )
-        cond = Condition(
-            id=uuid4(),
-            description="Test passes",
-            role=ConditionRole.BLOCKING,
-        )
-        cond.check_status = CheckStatus.PASS
-        cond.approve()
-        cond.evidence_ref = EvidenceRef(
-            task_id=task.id,
-            condition_id=cond.id,
-            check_id=None,
-            artifact_path_rel="artifact.json",
-            log_path_rel="log.txt",
-        )
-        task.conditions = [cond]
-        return task
-
-    @pytest.fixture
-    def task_blocked(self, tmp_path):
-        """Task that is blocked."""
-        task = Task(
-            id=uuid4(),
-            description="Test task",
-            goals=["Goal"],
-            sources=[str(tmp_path)],
-        )
-        task.status = TaskStatus.BLOCKED
-        cond = Condition(
-            id=uuid4(),
-            description="Manual approval",
-            role=ConditionRole.BLOCKING,
-        )
-        # Not approved
-        task.conditions = [cond]
-        return task
-
-    @pytest.fixture
-    def task_stopped(self, tmp_path):
-        """Task that is stopped."""
-        task = Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Test task",
             goals=["Goal"],
-            sources=[str(tmp_path)],
-            budget=Budget(max_iterations=10, iteration_count=10),  # Exhausted
+            sources=[str(shared_tmp)],
         )
-        cond = Condition(
-            id=uuid4(),
-            description="Test passes",
-            role=ConditionRole.BLOCKING,
-        )
-        cond.check_status = CheckStatus.FAIL
-        task.conditions = [cond]
+        task.conditions = [
+            _make_condition(task.id, status=CheckStatus.PASS, approve=True, evidence=True)
+        ]
         return task
 
     @pytest.mark.asyncio
@@ -411,70 +430,52 @@ class TestFinalizeTask:
         mock_task_repo.save.assert_called()
 
     @pytest.mark.asyncio
-    async def test_execute_blocked(self, finalize_use_case, task_blocked, mock_task_repo):
-        """Execute should return BLOCKED when task is blocked."""
-        result = await finalize_use_case.execute(task_blocked)
-
-        assert result.status == TaskStatus.BLOCKED
-        assert result.blocked_reason is not None
-        assert "approval" in result.blocked_reason.lower()
-
-    @pytest.mark.asyncio
-    async def test_execute_stopped_max_iterations(
-        self, finalize_use_case, task_stopped, mock_task_repo
+    @pytest.mark.parametrize(
+        ("build_task", "expected_status", "reason_field", "reason_fragment"),
+        [
+            pytest.param(
+                _blocked_task, TaskStatus.BLOCKED, "blocked_reason", "approval", id="blocked"
+            ),
+            pytest.param(
+                functools.partial(_failing_task, max_iterations=10, iteration_count=10),
+                TaskStatus.STOPPED,
+                "stopped_reason",
+                "iteration",
+                id="stopped-max-iterations",
+            ),
+            pytest.param(
+                functools.partial(_failing_task, stagnation_limit=3, stagnation_count=3),
+                TaskStatus.STOPPED,
+                "stopped_reason",
+                "stagnation",
+                id="stopped-stagnation",
+            ),
+            pytest.param(
+                functools.partial(_failing_task, wall_time_limit_s=100, elapsed_s=100),
+                TaskStatus.STOPPED,
+                "stopped_reason",
+                "time",
+                id="stopped-wall-time",
+            ),
+        ],
+    )
+    async def test_execute_not_done(
+        self,
+        finalize_use_case,
+        mock_task_repo,
+        shared_tmp,
+        build_task,
+        expected_status,
+        reason_field,
+        reason_fragment,
     ):
-        """Execute should return STOPPED with reason when budget exhausted."""
-        result = await finalize_use_case.execute(task_stopped)
-
-        assert result.status == TaskStatus.STOPPED
-        assert result.stopped_reason is not None
-        assert "iteration" in result.stopped_reason.lower()
-
-    @pytest.mark.asyncio
-    async def test_execute_stopped_stagnation(self, finalize_use_case, mock_task_repo, tmp_path):
-        """Execute should return STOPPED with stagnation reason."""
-        task = Task(
-            id=uuid4(),
-            description="Test",
-            goals=["Goal"],
-            sources=[str(tmp_path)],
-            budget=Budget(stagnation_limit=3, stagnation_count=3),
-        )
-        cond = Condition(
-            id=uuid4(),
-            description="Test",
-            role=ConditionRole.BLOCKING,
-        )
-        cond.check_status = CheckStatus.FAIL
-        task.conditions = [cond]
-
-        result = await finalize_use_case.execute(task)
-
-        assert result.status == TaskStatus.STOPPED
-        assert "stagnation" in result.stopped_reason.lower()
-
-    @pytest.mark.asyncio
-    async def test_execute_stopped_wall_time(self, finalize_use_case, mock_task_repo, tmp_path):
-        """Execute should return STOPPED with wall time reason."""
-        task = Task(
-            id=uuid4(),
-            description="Test",
-            goals=["Goal"],
-            sources=[str(tmp_path)],
-            budget=Budget(wall_time_limit_s=100, elapsed_s=100),
-        )
-        cond = Condition(
-            id=uuid4(),
-            description="Test",
-            role=ConditionRole.BLOCKING,
-        )
-        cond.check_status = CheckStatus.FAIL
-        task.conditions = [cond]
-
-        result = await finalize_use_case.execute(task)
+        """Execute should return BLOCKED or STOPPED with a matching reason."""
+        result = await finalize_use_case.execute(build_task(str(shared_tmp)))
 
-        assert result.status == TaskStatus.STOPPED
-        assert "time" in result.stopped_reason.lower()
+        assert result.status == expected_status
+        reason = getattr(result, reason_field)
+        assert reason is not None
+        assert reason_fragment in reason.lower()
 
     @pytest.mark.asyncio
     async def test_execute_collects_conditions(
@@ -489,30 +490,18 @@ class TestFinalizeTask:
 
     @pytest.mark.asyncio
     async def test_execute_collects_evidence_refs(
-        self, finalize_use_case, mock_task_repo, tmp_path
+        self, finalize_use_case, mock_task_repo, shared_tmp
     ):
         """Execute should collect evidence refs."""
         task = Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
-        )
-        cond = Condition(
-            id=uuid4(),
-            description="Test",
-            role=ConditionRole.BLOCKING,
-        )
-        cond.check_status = CheckStatus.PASS
-        cond.approve()
-        cond.evidence_ref = EvidenceRef(
-            task_id=task.id,
-            condition_id=cond.id,
-            check_id=None,
-            artifact_path_rel="path/to/artifact",
-            log_path_rel="path/to/log",
+            sources=[str(shared_tmp)],
         )
-        task.conditions = [cond]
+        task.conditions = [
+            _make_condition(task.id, status=CheckStatus.PASS, approve=True, evidence=True)
+        ]
 
         result = await finalize_use_case.execute(task)
 
@@ -523,36 +512,31 @@ class TestFinalizeTask:
 
 
 class TestDefineConditions:
-    @pytest.fixture
-    def mock_task_repo(self):
-        return AsyncMock()
-
     @pytest.fixture
     def mock_agent(self):
-        agent = AsyncMock()
+        agent = AsyncMock(spec=AgentPort)
         # Default: agent selects all available checks
-        agent.execute.return_value = MagicMock(
+        agent.execute.return_value = SimpleNamespace(
             final_response='{"selected_checks": ["pytest"], "reasoning": "Test check needed"}'
         )
         return agent
 
     @pytest.fixture
-    def task_with_inventory(self, tmp_path):
+    def task_with_inventory(self, shared_tmp):
         task = Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[str(shared_tmp)],
         )
-        check_id = uuid4()
         task.verification_inventory = VerificationInventory(
             checks=[
                 CheckSpec(
-                    id=check_id,
+                    id=_CHECK_ID,
                     name="pytest",
                     kind=CheckKind.TEST,
                     command="pytest",
-                    cwd=str(tmp_path),
+                    cwd=str(shared_tmp),
                 )
             ],
             baseline=None,
@@ -590,13 +574,13 @@ class TestDefineConditions:
         assert len(signal_conditions) == 2
 
     @pytest.mark.asyncio
-    async def test_execute_without_inventory(self, mock_agent, mock_task_repo, tmp_path):
+    async def test_execute_without_inventory(self, mock_agent, mock_task_repo, shared_tmp):
         """Execute should work without verification inventory."""
         task = Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[str(shared_tmp)],
         )
         use_case = DefineConditions(mock_agent, mock_task_repo)
 
@@ -617,33 +601,37 @@ class TestDefineConditions:
         assert len(conditions) == 1  # Only from inventory
 
     @pytest.mark.asyncio
-    async def test_agent_filters_irrelevant_checks(self, mock_agent, mock_task_repo, tmp_path):
+    async def test_agent_filters_irrelevant_checks(self, mock_agent, mock_task_repo, shared_tmp):
         """Agent should filter out checks not relevant to the task."""
         # Setup task with multiple checks
         task = Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Fix typo in README",
             goals=["Fix documentation typo"],
-            sources=[str(tmp_path)],
+            sources=[str(shared_tmp)],
         )
         task.verification_inventory = VerificationInventory(
             checks=[
                 CheckSpec(
-                    id=uuid4(),
+                    id=_CHECK_ID,
                     name="pytest",
                     kind=CheckKind.TEST,
                     command="pytest",
-                    cwd=str(tmp_path),
+                    cwd=str(shared_tmp),
                 ),
                 CheckSpec(
-                    id=uuid4(), name="lint", kind=CheckKind.LINT, command="ruff", cwd=str(tmp_path)
+                    id=_LINT_CHECK_ID,
+                    name="lint",
+                    kind=CheckKind.LINT,
+                    command="ruff",
+                    cwd=str(shared_tmp),
                 ),
                 CheckSpec(
-                    id=uuid4(),
+                    id=_BUILD_CHECK_ID,
                     name="build",
                     kind=CheckKind.BUILD,
                     command="build",
-                    cwd=str(tmp_path),
+                    cwd=str(shared_tmp),
                 ),
             ],
             baseline=None,
@@ -652,7 +640,7 @@ class TestDefineConditions:
         )
 
         # Agent only selects lint for README fix
-        mock_agent.execute.return_value = MagicMock(
+        mock_agent.execute.return_value = SimpleNamespace(
             final_response='{"selected_checks": ["lint"], "reasoning": "Only lint matters for docs"}'
         )
 
@@ -670,8 +658,8 @@ class TestDefineConditions:
 class TestBuildVerificationInventory:
     @pytest.fixture
     def mock_verification_port(self):
-        port = AsyncMock()
-        port.analyze_project.return_value = MagicMock(
+        port = AsyncMock(spec=VerificationPort)
+        port.analyze_project.return_value = SimpleNamespace(
             commands={
                 "test": "pytest",
                 "lint": "ruff check",
@@ -685,9 +673,9 @@ class TestBuildVerificationInventory:
 
     @pytest.fixture
     def mock_check_runner(self):
-        runner = AsyncMock()
-        runner.run_check.return_value = MagicMock(
-            check_id=uuid4(),
+        runner = AsyncMock(spec=CheckRunnerPort)
+        runner.run_check.return_value = SimpleNamespace(
+            check_id=_CHECK_ID,
             status=CheckStatus.PASS,
             exit_code=0,
             stdout="OK",
@@ -698,16 +686,12 @@ class TestBuildVerificationInventory:
         return runner
 
     @pytest.fixture
-    def mock_task_repo(self):
-        return AsyncMock()
-
-    @pytest.fixture
-    def task(self, tmp_path):
+    def task(self, shared_tmp):
         return Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[str(shared_tmp)],
         )
 
     @pytest.mark.asyncio
@@ -775,7 +759,7 @@ class TestBuildVerificationInventory:
         self, mock_verification_port, mock_check_runner, mock_task_repo, task
     ):
         """Execute should skip empty commands."""
-        mock_verification_port.analyze_project.return_value = MagicMock(
+        mock_verification_port.analyze_project.return_value = SimpleNamespace(
             commands={"test": "pytest", "lint": "", "build": None},
             structure={},
             conventions=[],
@@ -805,23 +789,19 @@ class TestBuildVerificationInventory:
 class TestRunQualityLoop:
     @pytest.fixture
     def mock_agent(self):
-        return AsyncMock()
+        return AsyncMock(spec=AgentPort)
 
     @pytest.fixture
     def mock_check_runner(self):
-        return AsyncMock()
-
-    @pytest.fixture
-    def mock_task_repo(self):
-        return AsyncMock()
+        return AsyncMock(spec=CheckRunnerPort)
 
     @pytest.fixture
-    def task(self, tmp_path):
+    def task(self, shared_tmp):
         return Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[str(shared_tmp)],
         )
 
     @pytest.mark.asyncio
@@ -873,14 +853,14 @@ class TestRunQualityLoop:
 
     @pytest.mark.asyncio
     async def test_execute_respects_budget_limit(
-        self, mock_agent, mock_check_runner, mock_task_repo, tmp_path
+        self, mock_agent, mock_check_runner, mock_task_repo, shared_tmp
     ):
         """Execute should respect quality_loop_limit budget."""
         task = Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Test",
             goals=["Goal"],
-            sources=[str(tmp_path)],
+            sources=[str(shared_tmp)],
             budget=Budget(quality_loop_limit=1, quality_loop_count=0),
         )
         mock_agent.execute.return_value = AgentResult(
@@ -902,30 +882,30 @@ class TestRunQualityLoop:
 
 class TestSelectStrategy:
     @pytest.fixture
-    def simple_task(self, tmp_path):
+    def simple_task(self, shared_tmp):
         return Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Simple feature",
             goals=["Goal 1"],
-            sources=[str(tmp_path)],
+            sources=[str(shared_tmp)],
         )
 
     @pytest.fixture
-    def complex_task(self, tmp_path):
+    def complex_task(self, shared_tmp):
         return Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Multi-step refactor",
             goals=["Goal 1", "Goal 2", "Goal 3", "Goal 4"],
-            sources=[str(tmp_path)],
+            sources=[str(shared_tmp)],
         )
 
     @pytest.fixture
-    def monorepo_task(self, tmp_path):
+    def monorepo_task(self, shared_tmp):
         return Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Cross-repo change",
             goals=["Goal 1"],
-            sources=[str(tmp_path / "repo1"), str(tmp_path / "repo2")],
+            sources=[str(shared_tmp / "repo1"), str(shared_tmp / "repo2")],
         )
 
     @pytest.mark.asyncio
@@ -950,13 +930,13 @@ class TestSelectStrategy:
         assert strategy.discovery_depth == "standard"
 
     @pytest.mark.asyncio
-    async def test_execute_multi_keyword_task(self, tmp_path):
+    async def test_execute_multi_keyword_task(self, shared_tmp):
         """Execute should detect multi keyword in description."""
         task = Task(
-            id=uuid4(),
+            id=_TASK_ID,
             description="Implement multi-database support",
             goals=["Goal 1"],
-            sources=[str(tmp_path)],
+            sources=[str(shared_tmp)],
         )
         use_case = SelectStrategy()
 
@@ -339,6 +339,17 @@ class TestIteration:
         assert iteration.number == 1
         assert iteration.decision == IterationDecision.CONTINUE
 
+    def test_failed_check_ids(self) -> None:
+        failed_id, passed_id = uuid4(), uuid4()
+        iteration = Iteration(
+            number=1,
+            goal="Fix tests",
+            check_results={failed_id: CheckStatus.FAIL, passed_id: CheckStatus.PASS},
+            decision=IterationDecision.CONTINUE,
+            decision_reason="One check still failing",
+        )
+        assert iteration.failed_check_ids == frozenset({failed_id})
+
 
 class TestPlan:
     def test_plan_creation(self) -> None:
@@ -280,6 +280,62 @@ class TestMCPServerRegistry:
         assert len(browser_templates) == 2
         assert all(t.category == "browser" for t in browser_templates)
 
+    def test_list_by_category_after_reregister(self) -> None:
+        """Test re-registering a template under a new category moves it."""
+        registry = MCPServerRegistry()
+        registry.register(
+            MCPServerTemplate(
+                name="fetch",
+                description="",
+                type=MCPServerType.STDIO,
+                install_source=MCPInstallSource.NONE,
+                category="web",
+            )
+        )
+        registry.register(
+            MCPServerTemplate(
+                name="fetch",
+                description="",
+                type=MCPServerType.STDIO,
+                install_source=MCPInstallSource.NONE,
+                category="search",
+            )
+        )
+
+        assert registry.list_by_category("web") == []
+        assert [t.name for t in registry.list_by_category("search")] == ["fetch"]
+
+    def test_list_by_category_with_templates_at_construction(self) -> None:
+        """Test templates passed to the constructor are listed by category."""
+        template = MCPServerTemplate(
+            name="sqlite",
+            description="",
+            type=MCPServerType.STDIO,
+            install_source=MCPInstallSource.NONE,
+            category="database",
+        )
+        registry = MCPServerRegistry(templates={"sqlite": template})
+
+        assert registry.list_by_category("database") == [template]
+
+    def test_list_by_category_reads_templates_directly(self) -> None:
+        """Test templates set without register() are listed by category."""
+        template = MCPServerTemplate(
+            name="sqlite",
+            description="",
+            type=MCPServerType.STDIO,
+            install_source=MCPInstallSource.NONE,
+            category="database",
+        )
+        registry = MCPServerRegistry()
+        registry.templates["sqlite"] = template
+
+        assert registry.list_by_category("database") == [template]
+
+        registry.templates = {}
+
+        assert registry.list_by_category("database") == []
+
     def test_get_categories(self) -> None:
         """Test getting all unique categories."""
         registry = MCPServerRegistry()